@@ -0,0 +1,103 @@
+"""Array kernels for the per-step noise applied by :mod:`noisyenv.wrappers`.
+
+The kernels are written with NumPy ufuncs writing into preallocated buffers so that they run unchanged when Numba is
+not installed. When it is installed they are compiled with ``numba.njit``, which removes the NumPy dispatch overhead
+that dominates the cost of a step for small observations. The compiled code is cached on disk, so the compilation is
+only paid by the first process using each kind of observation. Setting the ``NUMBA_DISABLE_JIT=1`` environment
+variable skips the compilation altogether, e.g. for short-lived processes.
+"""
+import numpy as np
+
+try:
+    from numba import config, njit
+    JIT_ENABLED = not config.DISABLE_JIT
+except ImportError:
+    JIT_ENABLED = False
+
+    def njit(*args, **kwargs):
+        """Fallback for :func:`numba.njit` returning the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def mixup(observation, last_observation, factor, one_minus_factor, scratch):
+    """Replaces the observation in place by factor * observation + one_minus_factor * last_observation and returns it.
+
+    The observation must have a floating point dtype. ``scratch`` is a preallocated array of the observation's shape
+    and dtype used to hold the intermediate product.
+    """
+    np.multiply(last_observation, one_minus_factor, scratch)
+    np.multiply(observation, factor, observation)
+    np.add(observation, scratch, observation)
+    return observation
+
+
+@njit(cache=True)
+def mixup_uint8(observation, last_observation, weight, last_weight, scratch, last_scratch):
+    """Replaces the uint8 observation in place by its fixed point mixup with last_observation and returns it.
+
+    The result is (weight * observation + last_weight * last_observation + 128) >> 8, which is the mixup rounded to
+    the nearest integer for factor = weight / 256, computed without converting the observations to floating point.
+    ``weight`` and ``last_weight`` are ``np.uint16`` summing to 256 and ``scratch`` and ``last_scratch`` are
+    preallocated uint16 arrays of the observation's shape.
+    """
+    scratch[...] = observation
+    scratch *= weight
+    last_scratch[...] = last_observation
+    last_scratch *= last_weight
+    scratch += last_scratch
+    scratch += np.uint16(128)
+    scratch >>= np.uint16(8)
+    observation[...] = scratch
+    return observation
+
+
+@njit(cache=True, fastmath=True)
+def add_affine(observation, sample, offset, scale, scratch):
+    """Adds offset + scale * sample to the observation in place and returns it.
+
+    ``scratch`` is a preallocated array of the sample's shape and dtype used to hold the noise.
+    """
+    np.multiply(sample, scale, scratch)
+    np.add(scratch, offset, scratch)
+    np.add(observation, scratch, observation)
+    return observation
+
+
+@njit(cache=True)
+def add_saturate_uint8(observation, noise, scratch):
+    """Adds int16 noise to the uint8 observation in place, saturating to [0, 255], and returns it.
+
+    ``scratch`` is a preallocated int16 array of the observation's shape used to hold the widened sum.
+    """
+    scratch[...] = observation
+    scratch += noise
+    np.clip(scratch, 0, 255, scratch)
+    observation[...] = scratch
+    return observation
+
+
+@njit(cache=True, fastmath=True)
+def multiply_affine(observation, sample, offset, scale, scratch):
+    """Multiplies the observation by offset + scale * sample in place and returns it.
+
+    ``scratch`` is a preallocated array of the sample's shape and dtype used to hold the scaling factors.
+    """
+    np.multiply(sample, scale, scratch)
+    np.add(scratch, offset, scratch)
+    np.multiply(observation, scratch, observation)
+    return observation
+
+
+def warmup(kernel, observation_space, *args):
+    """Compiles the kernel for observations of the given space by calling it on a dummy observation.
+
+    Args:
+        kernel (callable): One of the kernels of this module.
+        observation_space (gym.Space): The observation space of the environment.
+        *args: The remaining arguments of the kernel.
+    """
+    if JIT_ENABLED:
+        kernel(np.zeros(observation_space.shape, dtype=observation_space.dtype), *args)
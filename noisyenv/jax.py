@@ -0,0 +1,151 @@
+"""Pure JAX versions of the :mod:`noisyenv.wrappers` for jittable functional environments.
+
+Each transform is a pure function ``(key, observation, last_observation) -> observation`` built from the same
+arguments as the corresponding wrapper, and :func:`wrap` composes them with the ``reset`` and ``step`` functions of a
+gymnax-style environment. When the environment is itself jittable, the whole step, including the noise gates and the
+noise of every transform, is compiled by ``jax.jit`` into a single XLA computation without any per-step Python calls.
+The transforms expect floating point observations.
+This module requires JAX, which can be installed with ``pip install noisyenv[jax]``.
+"""
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError as e:
+    raise ImportError("noisyenv.jax requires JAX, install it with `pip install noisyenv[jax]`") from e
+
+
+def _gated(noise_rate, noisy):
+    """Returns a transform applying ``noisy(key, observation, last_observation)`` with probability noise_rate."""
+    def transform(key, observation, last_observation):
+        gate_key, key = jax.random.split(key)
+        fire = jax.random.uniform(gate_key) <= noise_rate
+        return jnp.where(fire, noisy(key, observation, last_observation), observation)
+    return transform
+
+
+def mixup(noise_rate=0.01, factor=0.5):
+    """Returns a transform mixing the observation with the previous one, as :class:`RandomMixupObservation`.
+
+    Args:
+        noise_rate (float, optional): Probability of applying mixup to the observation each step.
+            Defaults to 0.01.
+        factor (float, optional): The mixup factor (factor * observation + (1 - factor) * last_observation).
+            Defaults to 0.5.
+    """
+    def noisy(key, observation, last_observation):
+        return (factor * observation + (1 - factor) * last_observation).astype(observation.dtype)
+    return _gated(noise_rate, noisy)
+
+
+def dropout(noise_rate=0.01, p=0.1):
+    """Returns a transform applying dropout to the observation, as :class:`RandomDropoutObservation`.
+
+    Args:
+        noise_rate (float, optional): Probability of applying dropout to the observation each step.
+            Defaults to 0.01.
+        p (float, optional): The probability of replacing an element of the observation with a 0. Defaults to 0.1.
+    """
+    def noisy(key, observation, last_observation):
+        return jnp.where(jax.random.bernoulli(key, 1 - p, observation.shape), observation, 0).astype(observation.dtype)
+    return _gated(noise_rate, noisy)
+
+
+def normal_noise(noise_rate=0.01, loc=0.0, scale=0.01):
+    """Returns a transform adding Normal noise to the observation, as :class:`RandomNormalNoisyObservation`.
+
+    Args:
+        noise_rate (float, optional): Probability of applying noise to the observation each step.
+            Defaults to 0.01.
+        loc (float, optional): Mean ("centre") of the noise distribution.
+            Defaults to 0.0.
+        scale (float, optional): Standard deviation (spread or "width") of the noise distribution.
+            Must be non-negative. Defaults to 0.01.
+    """
+    def noisy(key, observation, last_observation):
+        return observation + loc + scale * jax.random.normal(key, observation.shape, observation.dtype)
+    return _gated(noise_rate, noisy)
+
+
+def uniform_noise(noise_rate=0.01, low=-0.1, high=0.1):
+    """Returns a transform adding Uniform noise to the observation, as :class:`RandomUniformNoisyObservation`.
+
+    Args:
+        noise_rate (float, optional): Probability of applying noise to the observation each step.
+            Defaults to 0.01.
+        low (float, optional): Lower boundary of the noise distribution.
+            Defaults to -0.1.
+        high (float, optional): Upper boundary of the noise distribution.
+            Defaults to 0.1.
+    """
+    def noisy(key, observation, last_observation):
+        return observation + jax.random.uniform(key, observation.shape, observation.dtype, low, high)
+    return _gated(noise_rate, noisy)
+
+
+def uniform_scale(noise_rate=0.01, low=0.9, high=1.1, size=1):
+    """Returns a transform scaling the observation by Uniform noise, as :class:`RandomUniformScaleObservation`.
+
+    Args:
+        noise_rate (float, optional): Probability of applying noise to the observation each step.
+            Defaults to 0.01.
+        low (float, optional): Lower boundary of the noise distribution.
+            Defaults to 0.9.
+        high (float, optional): Upper boundary of the noise distribution.
+            Defaults to 1.1.
+        size (int or tuple of ints, optional): Shape of the noise, None to use the shape of the observation.
+            Defaults to 1.
+    """
+    def noisy(key, observation, last_observation):
+        shape = observation.shape if size is None else size
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        return observation * jax.random.uniform(key, shape, observation.dtype, low, high)
+    return _gated(noise_rate, noisy)
+
+
+def wrap(env, transforms):
+    """Returns jitted ``reset`` and ``step`` functions of the environment applying the transforms to its observations.
+
+    The environment must follow the gymnax API, with ``env.reset(key, params)`` returning ``(obs, state)`` and
+    ``env.step(key, state, action, params)`` returning ``(obs, state, reward, done, info)`` and resetting itself when
+    the episode is done. The returned functions have the same signatures, with the state extended by the previous
+    observation used for mixup. As with :class:`RandomMixupObservation`, the first observation of an episode is never
+    mixed with the previous episode.
+
+    Example:
+        >>> from noisyenv import jax as noisy_jax
+        >>> reset, step = noisy_jax.wrap(env, [noisy_jax.normal_noise(0.1, scale=0.1), noisy_jax.mixup(0.1)])
+        >>> obs, state = reset(key)
+        >>> obs, state, reward, done, info = step(key, state, action)
+
+    Args:
+        env: The jittable functional environment to apply the transforms to.
+        transforms (list of callable): The transforms built by the functions of this module, applied in order.
+
+    Returns:
+        tuple: The jitted ``reset(key, params=None)`` and ``step(key, state, action, params=None)`` functions.
+    """
+    transforms = tuple(transforms)
+
+    def apply(key, observation, last_observation):
+        for transform, subkey in zip(transforms, jax.random.split(key, max(1, len(transforms)))):
+            observation = transform(subkey, observation, last_observation)
+        return observation
+
+    @jax.jit
+    def reset(key, params=None):
+        env_key, key = jax.random.split(key)
+        obs, env_state = env.reset(env_key, params)
+        obs = apply(key, obs, obs)
+        return obs, (env_state, obs)
+
+    @jax.jit
+    def step(key, state, action, params=None):
+        env_state, last_obs = state
+        env_key, key = jax.random.split(key)
+        obs, env_state, reward, done, info = env.step(env_key, env_state, action, params)
+        # The environment starts a new episode when done, whose first observation is not mixed
+        last_obs = jnp.where(done, obs, last_obs)
+        obs = apply(key, obs, last_obs)
+        return obs, (env_state, obs), reward, done, info
+
+    return reset, step
@@ -0,0 +1,350 @@
+"""Batched versions of the :mod:`noisyenv.wrappers` for vectorized environments.
+
+Each wrapper draws the noise gates and the noise for all sub-environments with a single call to the random number
+generator, so the per-step cost does not grow with the number of Python calls per sub-environment. The gates are
+applied without branching or boolean indexing by masking the noise of the sub-environments where the gate did not fire.
+These wrappers require the vector wrapper API of Gymnasium v1.0 or later.
+"""
+import gymnasium as gym
+import numpy as np
+
+
+def _batch_shape(num_envs, sample_shape, observation_shape):
+    """Returns the shape of a batch of per-environment samples that broadcasts against a batch of observations."""
+    sample_shape = (sample_shape,) if isinstance(sample_shape, (int, np.integer)) else tuple(sample_shape)
+    return (num_envs,) + (1,) * (len(observation_shape) - len(sample_shape)) + sample_shape
+
+
+class VectorRandomMixupObservation(gym.vector.VectorObservationWrapper):
+    """Adds random mixup noise to the observations of each sub-environment of a vectorized environment.
+
+    The mixup noise is a convex combination of the current observation and the previous observation.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.vector import VectorRandomMixupObservation
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=8)
+        >>> wrapped_envs = VectorRandomMixupObservation(envs, noise_rate=0.1, factor=0.3)
+    """
+
+    def __init__(self, env, noise_rate=0.01, factor=0.5, seed=None):
+        """Initializes the :class:`VectorRandomMixupObservation` wrapper.
+
+        Args:
+            env (gym.vector.VectorEnv): The vectorized environment to apply the wrapper
+            noise_rate (float, optional): Probability of applying mixup to the observation of each sub-environment
+                each step. Defaults to 0.01.
+            factor (float, optional): The mixup factor (factor * observation + (1 - factor) * last_observation).
+                Defaults to 0.5.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.noise_rate = noise_rate
+        self.factor = factor
+        self._rng = np.random.default_rng(seed)
+        space = env.single_observation_space
+        self._mask_shape = _batch_shape(self.num_envs, (), space.shape)
+        self._floating = np.issubdtype(space.dtype, np.floating)
+        # The previous observations are copied into a slot owned by the wrapper, as in RandomMixupObservation
+        self._last_observations = np.empty((self.num_envs,) + space.shape, dtype=space.dtype)
+        self._has_last = False
+        # The sub-environments whose episode ended, whose next observation starts a new episode
+        self._done = np.zeros(self._mask_shape, dtype=bool)
+
+    def reset(self, **kwargs):
+        """Resets the environments, returning their unmodified first observations.
+
+        The observations are never mixed with the previous episodes, either on reset or when a sub-environment is
+        autoreset.
+        """
+        obs, info = self.env.reset(**kwargs)
+        np.copyto(self._last_observations, obs, casting="unsafe")
+        self._has_last = True
+        self._done[...] = False
+        return obs, info
+
+    def step(self, actions):
+        """Steps the environments, returning potentially modified observations using :meth:`self.observations`."""
+        obs, rewards, terminations, truncations, infos = self.env.step(actions)
+        done = np.logical_or(terminations, truncations).reshape(self._mask_shape)
+        # The sub-environments done on the previous step are autoreset on this one and return the first observation
+        # of their new episode, which is mixed with itself
+        np.copyto(self._last_observations, obs, casting="unsafe", where=self._done)
+        self._done = done
+        return self.observations(obs), rewards, terminations, truncations, infos
+
+    def observations(self, observations):
+        """Returns the potentially modified observations."""
+        if not self._has_last:
+            return observations
+
+        mask = self._rng.random(self._mask_shape) <= self.noise_rate
+        weights = np.where(mask, self.factor, 1.0)
+        mixed = weights * observations + (1 - weights) * self._last_observations
+        observations[...] = mixed if self._floating else np.rint(mixed)
+
+        np.copyto(self._last_observations, observations)
+
+        return observations
+
+
+class VectorRandomDropoutObservation(gym.vector.VectorObservationWrapper):
+    """Applies dropout to the observations of each sub-environment of a vectorized environment.
+
+    Dropout randomly replaces elements of the observation with 0 with probability p.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.vector import VectorRandomDropoutObservation
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=8)
+        >>> wrapped_envs = VectorRandomDropoutObservation(envs, noise_rate=0.1, p=0.5)
+    """
+
+    def __init__(self, env, noise_rate=0.01, p=0.1, seed=None):
+        """Initializes the :class:`VectorRandomDropoutObservation` wrapper.
+
+        Args:
+            env (gym.vector.VectorEnv): The vectorized environment to apply the wrapper
+            noise_rate (float, optional): Probability of applying dropout to the observation of each sub-environment
+                each step. Defaults to 0.01.
+            p (float, optional): The probability of replacing an element of the observation with a 0. Defaults to 0.1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.noise_rate = noise_rate
+        self.p = p
+        self._rng = np.random.default_rng(seed)
+        self._mask_shape = _batch_shape(self.num_envs, (), env.single_observation_space.shape)
+
+    def observations(self, observations):
+        """Returns the potentially modified observations."""
+        mask = self._rng.random(self._mask_shape) <= self.noise_rate
+        keep = self._rng.random(observations.shape) >= self.p
+        observations *= keep | ~mask
+        return observations
+
+
+class VectorRandomNormalNoisyObservation(gym.vector.VectorObservationWrapper):
+    """Adds random Normal noise to the observations of each sub-environment of a vectorized environment.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.vector import VectorRandomNormalNoisyObservation
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=8)
+        >>> wrapped_envs = VectorRandomNormalNoisyObservation(envs, noise_rate=0.1, loc=0.0, scale=0.1)
+    """
+
+    def __init__(self, env, noise_rate=0.01, loc=0.0, scale=0.01, seed=None):
+        """Initializes the :class:`VectorRandomNormalNoisyObservation` wrapper.
+
+        Args:
+            env (gym.vector.VectorEnv): The vectorized environment to apply the wrapper
+            noise_rate (float, optional): Probability of adding noise to the observation of each sub-environment
+                each step. Defaults to 0.01.
+            loc (float, optional): Mean ("centre") of the noise distribution.
+                Defaults to 0.0.
+            scale (float, optional): Standard deviation (spread or "width") of the noise distribution.
+                Must be non-negative. Defaults to 0.01.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.noise_rate = noise_rate
+        self.loc = loc
+        self.scale = scale
+        self._rng = np.random.default_rng(seed)
+        self._mask_shape = _batch_shape(self.num_envs, (), env.single_observation_space.shape)
+
+    def observations(self, observations):
+        """Returns the potentially modified observations."""
+        mask = self._rng.random(self._mask_shape) <= self.noise_rate
+        observations += mask * self._rng.normal(self.loc, self.scale, observations.shape)
+        return observations
+
+
+class VectorRandomUniformNoisyObservation(gym.vector.VectorObservationWrapper):
+    """Adds random Uniform noise to the observations of each sub-environment of a vectorized environment.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.vector import VectorRandomUniformNoisyObservation
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=8)
+        >>> wrapped_envs = VectorRandomUniformNoisyObservation(envs, noise_rate=0.1, low=-0.1, high=0.1)
+    """
+
+    def __init__(self, env, noise_rate=0.01, low=-0.1, high=0.1, seed=None):
+        """Initializes the :class:`VectorRandomUniformNoisyObservation` wrapper.
+
+        Args:
+            env (gym.vector.VectorEnv): The vectorized environment to apply the wrapper
+            noise_rate (float, optional): Probability of adding noise to the observation of each sub-environment
+                each step. Defaults to 0.01.
+            low (float, optional): Lower boundary of the noise distribution.
+                Defaults to -0.1.
+            high (float, optional): Upper boundary of the noise distribution.
+                Defaults to 0.1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.noise_rate = noise_rate
+        self.low = low
+        self.high = high
+        self._rng = np.random.default_rng(seed)
+        self._mask_shape = _batch_shape(self.num_envs, (), env.single_observation_space.shape)
+
+    def observations(self, observations):
+        """Returns the potentially modified observations."""
+        mask = self._rng.random(self._mask_shape) <= self.noise_rate
+        observations += mask * self._rng.uniform(self.low, self.high, observations.shape)
+        return observations
+
+
+class VectorRandomUniformScaleObservation(gym.vector.VectorObservationWrapper):
+    """Scales the observations of each sub-environment of a vectorized environment by random Uniform noise.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.vector import VectorRandomUniformScaleObservation
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=8)
+        >>> wrapped_envs = VectorRandomUniformScaleObservation(envs, noise_rate=0.1, low=0.9, high=1.1)
+    """
+
+    def __init__(self, env, noise_rate=0.01, low=0.9, high=1.1, size=1, seed=None):
+        """Initializes the :class:`VectorRandomUniformScaleObservation` wrapper.
+
+        Args:
+            env (gym.vector.VectorEnv): The vectorized environment to apply the wrapper
+            noise_rate (float, optional): Probability of applying noise to the observation of each sub-environment
+                each step. Defaults to 0.01.
+            low (float, optional): Lower boundary of the noise distribution.
+                Defaults to 0.9.
+            high (float, optional): Upper boundary of the noise distribution.
+                Defaults to 1.1.
+            size (int, optional): The number of scaling factors to sample for each sub-environment.
+                If None then size is equal to the shape of a single observation. Defaults to 1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.noise_rate = noise_rate
+        self.low = low
+        self.high = high
+        self.size = size
+        self._rng = np.random.default_rng(seed)
+        observation_shape = env.single_observation_space.shape
+        self._mask_shape = _batch_shape(self.num_envs, (), observation_shape)
+        self._scale_shape = _batch_shape(
+            self.num_envs, observation_shape if size is None else size, observation_shape
+        )
+
+    def observations(self, observations):
+        """Returns the potentially modified observations."""
+        mask = self._rng.random(self._mask_shape) <= self.noise_rate
+        observations *= np.where(mask, self._rng.uniform(self.low, self.high, self._scale_shape), 1.0)
+        return observations
+
+
+class VectorRandomUniformScaleReward(gym.vector.VectorRewardWrapper):
+    """Scales the rewards of each sub-environment of a vectorized environment by random Uniform noise.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.vector import VectorRandomUniformScaleReward
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=8)
+        >>> wrapped_envs = VectorRandomUniformScaleReward(envs, noise_rate=0.1, low=0.9, high=1.1)
+    """
+
+    def __init__(self, env, noise_rate=0.01, low=0.9, high=1.1, seed=None):
+        """Initializes the :class:`VectorRandomUniformScaleReward` wrapper.
+
+        Args:
+            env (gym.vector.VectorEnv): The vectorized environment to apply the wrapper
+            noise_rate (float, optional): Probability of applying noise to the reward of each sub-environment
+                each step. Defaults to 0.01.
+            low (float, optional): Lower boundary of the noise distribution.
+                Defaults to 0.9.
+            high (float, optional): Upper boundary of the noise distribution.
+                Defaults to 1.1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.noise_rate = noise_rate
+        self.low = low
+        self.high = high
+        self._rng = np.random.default_rng(seed)
+
+    def rewards(self, rewards):
+        """Returns the potentially modified rewards."""
+        mask = self._rng.random(self.num_envs) <= self.noise_rate
+        rewards *= np.where(mask, self._rng.uniform(self.low, self.high, self.num_envs), 1.0)
+        return rewards
+
+
+class VectorRandomUniformNoisyReward(gym.vector.VectorRewardWrapper):
+    """Adds random Uniform noise to the rewards of each sub-environment of a vectorized environment.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.vector import VectorRandomUniformNoisyReward
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=8)
+        >>> wrapped_envs = VectorRandomUniformNoisyReward(envs, noise_rate=0.1, low=-0.1, high=0.1)
+    """
+
+    def __init__(self, env, noise_rate=0.01, low=-0.01, high=0.01, seed=None):
+        """Initializes the :class:`VectorRandomUniformNoisyReward` wrapper.
+
+        Args:
+            env (gym.vector.VectorEnv): The vectorized environment to apply the wrapper
+            noise_rate (float, optional): Probability of adding noise to the reward of each sub-environment
+                each step. Defaults to 0.01.
+            low (float, optional): Lower boundary of the noise distribution.
+                Defaults to -0.01.
+            high (float, optional): Upper boundary of the noise distribution.
+                Defaults to 0.01.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.noise_rate = noise_rate
+        self.low = low
+        self.high = high
+        self._rng = np.random.default_rng(seed)
+
+    def rewards(self, rewards):
+        """Returns the potentially modified rewards."""
+        mask = self._rng.random(self.num_envs) <= self.noise_rate
+        rewards += mask * self._rng.uniform(self.low, self.high, self.num_envs)
+        return rewards
+
+
+class VectorRandomNormalNoisyReward(gym.vector.VectorRewardWrapper):
+    """Adds random Normal noise to the rewards of each sub-environment of a vectorized environment.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.vector import VectorRandomNormalNoisyReward
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=8)
+        >>> wrapped_envs = VectorRandomNormalNoisyReward(envs, noise_rate=0.1, scale=0.1)
+    """
+
+    def __init__(self, env, noise_rate=0.01, loc=0.0, scale=0.01, seed=None):
+        """Initializes the :class:`VectorRandomNormalNoisyReward` wrapper.
+
+        Args:
+            env (gym.vector.VectorEnv): The vectorized environment to apply the wrapper
+            noise_rate (float, optional): Probability of adding noise to the reward of each sub-environment
+                each step. Defaults to 0.01.
+            loc (float, optional): Mean ("centre") of the noise distribution.
+                Defaults to 0.0.
+            scale (float, optional): Standard deviation (spread or "width") of the noise distribution.
+                Must be non-negative. Defaults to 0.01.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.noise_rate = noise_rate
+        self.loc = loc
+        self.scale = scale
+        self._rng = np.random.default_rng(seed)
+
+    def rewards(self, rewards):
+        """Returns the potentially modified rewards."""
+        mask = self._rng.random(self.num_envs) <= self.noise_rate
+        rewards += mask * self._rng.normal(self.loc, self.scale, self.num_envs)
+        return rewards
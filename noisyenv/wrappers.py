@@ -1,6 +1,200 @@
+import collections
+import math
+import types
+
 import gymnasium as gym
 import numpy as np
 
+from noisyenv import _kernels
+
+
+class _GateBuffer:
+    """Pre-generated block of Bernoulli(noise_rate) draws used to decide whether noise is applied each step.
+
+    Drawing a single uniform per step is dominated by the Python/NumPy call overhead, so the draws are made a block
+    at a time and served one per step, refilling the block when it is exhausted. It serves the gates of all the
+    transforms of :class:`ComposedNoisyObservation` at once, while the other wrappers use :class:`_GeometricGate`.
+    """
+
+    def __init__(self, noise_rate, rng, block=4096):
+        """Initializes the :class:`_GateBuffer`.
+
+        Args:
+            noise_rate (float or np.ndarray): Probability of the gate firing each step. An array of probabilities
+                gives one gate per element, and :meth:`next` then returns a list with a bool for each of them.
+            rng (np.random.Generator): The random number generator used to draw the block.
+            block (int, optional): The number of draws generated at once. Defaults to 4096.
+        """
+        self.noise_rate = noise_rate
+        self.block = block
+        self._rng = rng
+        self._refill()
+
+    def _refill(self):
+        # Stored as a list of Python bools since indexing a list is cheaper than indexing a NumPy array
+        self._buf = (self._rng.random((self.block,) + np.shape(self.noise_rate)) <= self.noise_rate).tolist()
+        self._idx = 0
+
+    def next(self):
+        """Returns whether the gate fires this step."""
+        if self._idx == self.block:
+            self._refill()
+        fire = self._buf[self._idx]
+        self._idx += 1
+        return fire
+
+
+class _GeometricGate:
+    """Bernoulli(noise_rate) gate that draws the number of steps until it next fires instead of one draw per step.
+
+    The number of steps between consecutive firings of a Bernoulli(noise_rate) gate is Geometric(noise_rate), so each
+    draw covers about 1 / noise_rate steps and the steps in between only decrement a counter. The gaps themselves are
+    drawn a block at a time.
+    """
+
+    def __init__(self, noise_rate, rng, block=1024):
+        """Initializes the :class:`_GeometricGate`.
+
+        Args:
+            noise_rate (float): Probability of the gate firing each step.
+            rng (np.random.Generator): The random number generator used to draw the gaps.
+            block (int, optional): The number of gaps generated at once. Defaults to 1024.
+        """
+        self.noise_rate = noise_rate
+        self.block = block
+        self._rng = rng
+        if noise_rate <= 0:
+            # Never reaches 0, so the gate never fires
+            self._countdown = math.inf
+        else:
+            self._refill()
+            self._countdown = self._next_gap()
+
+    def _refill(self):
+        self._gaps = self._rng.geometric(min(self.noise_rate, 1.0), self.block).tolist()
+        self._idx = 0
+
+    def _next_gap(self):
+        if self._idx == self.block:
+            self._refill()
+        gap = self._gaps[self._idx]
+        self._idx += 1
+        return gap
+
+    def next(self):
+        """Returns whether the gate fires this step."""
+        self._countdown -= 1
+        if self._countdown:
+            return False
+        self._countdown = self._next_gap()
+        return True
+
+
+class _NoiseBuffer:
+    """Pre-generated block of standard Normal or standard Uniform deviates served one sample at a time.
+
+    Sampling a small noise array each step is dominated by the NumPy call overhead, so the deviates are drawn a block
+    at a time. The noise is recovered with an affine transform of each sample, ``loc + scale * z`` for Normal noise and
+    ``low + (high - low) * u`` for Uniform noise.
+    """
+
+    MAX_ELEMENTS = 2 ** 20
+
+    def __init__(self, shape, dist, rng, block=1000, transform=None, dtype=np.float64):
+        """Initializes the :class:`_NoiseBuffer`.
+
+        Args:
+            shape (int or tuple): The shape of a single sample.
+            dist (str): Either "normal" for N(0, 1) or "uniform" for U(0, 1) samples.
+            rng (np.random.Generator): The random number generator used to draw the block.
+            block (int, optional): The number of samples generated at once. Capped so that a block holds at most
+                :attr:`MAX_ELEMENTS` elements. Defaults to 1000.
+            transform (callable, optional): Applied to each freshly drawn block, e.g. to convert the deviates to the
+                final noise once per block rather than once per step. Defaults to None.
+            dtype (np.dtype, optional): The dtype the samples are drawn in, so that they can be added to observations
+                without an upcast. Dtypes other than float32 and float64 are drawn as float64. Defaults to np.float64.
+        """
+        if dist not in ("normal", "uniform"):
+            raise ValueError(f"dist must be 'normal' or 'uniform', got {dist!r}")
+        self.shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+        self.dist = dist
+        self._rng = rng
+        self._transform = transform
+        self.dtype = np.dtype(dtype) if np.dtype(dtype) in (np.float32, np.float64) else np.dtype(np.float64)
+        self.block = max(1, min(block, self.MAX_ELEMENTS // max(1, int(np.prod(self.shape)))))
+        self._refill()
+
+    def _refill(self):
+        size = (self.block,) + self.shape
+        if self.dist == "normal":
+            buf = self._rng.standard_normal(size, dtype=self.dtype)
+        else:
+            buf = self._rng.random(size, dtype=self.dtype)
+        if self._transform is not None:
+            buf = self._transform(buf)
+        # Scalar samples are stored as a list of Python floats as they are cheaper to index and do arithmetic with
+        self._buf = buf.tolist() if self.shape == () else buf
+        self._idx = 0
+
+    def next(self):
+        """Returns the next sample."""
+        if self._idx == self.block:
+            self._refill()
+        sample = self._buf[self._idx]
+        self._idx += 1
+        return sample
+
+
+def _identity(x):
+    return x
+
+
+def _specialize(wrapper, method, noise_rate):
+    """Rebinds the per-step ``method`` of the wrapper when its noise rate makes the gate deterministic.
+
+    A noise rate of 0 makes the method the wrapper's ``_noiseless_<method>``, or the identity if it has none, and a rate
+    of 1 makes it the wrapper's ``_noisy_<method>``, which applies the noise unconditionally, so that neither pays for
+    the gate each step.
+    """
+    if noise_rate <= 0:
+        setattr(wrapper, method, getattr(wrapper, f"_noiseless_{method}", _identity))
+    elif noise_rate >= 1:
+        setattr(wrapper, method, getattr(wrapper, f"_noisy_{method}"))
+    else:
+        # Falls back to the gated method of the class
+        vars(wrapper).pop(method, None)
+
+
+def _noise_rate_property(method):
+    """Returns the ``noise_rate`` property of a wrapper whose per-step ``method`` is gated by the noise rate.
+
+    Setting the noise rate rebuilds the gate of the wrapper and re-specializes ``method``, so that the noise rate can be
+    changed between steps, e.g. following a schedule.
+    """
+    def fget(self):
+        return self._noise_rate
+
+    def fset(self, noise_rate):
+        self._noise_rate = noise_rate
+        self._gate = _GeometricGate(noise_rate, self._rng)
+        _specialize(self, method, noise_rate)
+
+    return property(fget, fset, doc="Probability of applying the noise each step.")
+
+
+def _bound_property(name):
+    """Returns the ``low`` or ``high`` property of a wrapper with Uniform noise, keeping the cached width in sync."""
+    attr = f"_{name}"
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+        self._width = self._high - self._low
+
+    return property(fget, fset, doc=f"{name.capitalize()} boundary of the noise distribution.")
+
 
 class RandomMixupObservation(gym.ObservationWrapper):
     """Adds random mixup noise to the observations of the environment.
@@ -14,7 +208,9 @@ class RandomMixupObservation(gym.ObservationWrapper):
         >>> wrapped_env = RandomMixupObservation(env, noise_rate=0.1, factor=0.3)
     """
 
-    def __init__(self, env, noise_rate=0.01, factor=0.5):
+    noise_rate = _noise_rate_property("observation")
+
+    def __init__(self, env, noise_rate=0.01, factor=0.5, seed=None):
         """Initializes the :class:`RandomMixupObservation` wrapper.
 
         Args:
@@ -23,28 +219,185 @@ class RandomMixupObservation(gym.ObservationWrapper):
                 Defaults to 0.01.
             factor (float, optional): The mixup factor (factor * observation + (1 - factor) * last_observation).
                 Defaults to 0.5.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
         """
         super().__init__(env)
+        self._rng = np.random.default_rng(seed)
         self.noise_rate = noise_rate
+
+        space = env.observation_space
+        # The previous observation is copied into a slot owned by the wrapper, so that no reference to the arrays
+        # returned by the environment is kept alive between steps
+        self._last_observation = np.empty(space.shape, dtype=space.dtype)
+        self._has_last = False
+        self._floating = np.issubdtype(space.dtype, np.floating)
+        self._uint8 = space.dtype == np.uint8
+        if self._floating:
+            self._scratch = np.empty(space.shape, dtype=space.dtype)
+        elif self._uint8:
+            self._scratch = np.empty(space.shape, dtype=np.uint16)
+            self._last_scratch = np.empty(space.shape, dtype=np.uint16)
         self.factor = factor
-        self._last_observation = None
+
+        if self._floating:
+            _kernels.warmup(_kernels.mixup, space, np.zeros_like(self._scratch), factor, 1 - factor, self._scratch)
+        elif self._fixed_point:
+            _kernels.warmup(
+                _kernels.mixup_uint8, space, np.zeros(space.shape, dtype=np.uint8), self._weight, self._last_weight,
+                self._scratch, self._last_scratch
+            )
+
+    @property
+    def factor(self):
+        """The mixup factor (factor * observation + (1 - factor) * last_observation)."""
+        return self._factor
+
+    @factor.setter
+    def factor(self, factor):
+        # Both weights of the mixup are derived here, so they always sum to 1
+        self._factor = factor
+        self._one_minus_factor = 1 - factor
+        # Factors outside [0, 1] extrapolate beyond the uint8 range, so they fall back to the floating point mixup
+        self._fixed_point = self._uint8 and 0 <= factor <= 1
+        if self._fixed_point:
+            # Images are mixed in 8-bit fixed point, with the factor quantised to a multiple of 1/256
+            self._weight = np.uint16(round(factor * 256))
+            self._last_weight = np.uint16(256 - self._weight)
 
     def reset(self, **kwargs):
-        """Resets the environment, returning a potentially modified observation using :meth:`self.observation`."""
-        obs, info = super().reset(**kwargs)
-        self._last_observation = obs
+        """Resets the environment, returning the unmodified first observation of the episode.
+
+        The observation is copied into a buffer owned by the wrapper, so later mixups never alias the arrays returned
+        by the environment and never mix observations of different episodes.
+        """
+        obs, info = self.env.reset(**kwargs)
+        np.copyto(self._last_observation, obs, casting="unsafe")
+        self._has_last = True
         return obs, info
 
     def observation(self, observation):
         """Returns the potentially modified observation."""
-        if (np.random.rand() <= self.noise_rate) and (self._last_observation is not None):
-            observation = self.factor * observation + (1 - self.factor) * self._last_observation
+        if not self._has_last:
+            return observation
 
-        self._last_observation = observation
+        if self._gate.next():
+            return self._noisy_observation(observation)
+
+        np.copyto(self._last_observation, observation, casting="unsafe")
+
+        return observation
+
+    def _noiseless_observation(self, observation):
+        # Keeps tracking the previous observation, in case the noise rate is raised later on
+        if self._has_last:
+            np.copyto(self._last_observation, observation, casting="unsafe")
+        return observation
+
+    def _noisy_observation(self, observation):
+        # Also bound as the per-step method at a noise rate of 1, so it must not mix before the first reset
+        if not self._has_last:
+            return observation
+
+        if self._floating:
+            observation = _kernels.mixup(
+                observation, self._last_observation, self._factor, self._one_minus_factor, self._scratch
+            )
+        elif self._fixed_point:
+            observation = _kernels.mixup_uint8(
+                observation, self._last_observation, self._weight, self._last_weight, self._scratch,
+                self._last_scratch
+            )
+        else:
+            observation = self._factor * observation + self._one_minus_factor * self._last_observation
+
+        np.copyto(self._last_observation, observation, casting="unsafe")
 
         return observation
 
 
+class RandomMixupObservationBuffered(gym.Wrapper):
+    """Applies random mixup to the observations of the environment a whole rollout at a time.
+
+    The observations are returned unmodified by :meth:`step` and stored in a rollout buffer instead. Every
+    ``rollout_len`` steps, or when the environment is reset, the stored observations are mixed up with a single
+    vectorized operation and the resulting rollout is queued for :meth:`pop_rollout`. Unlike
+    :class:`RandomMixupObservation`, each observation is mixed with the previous unmodified observation, and the
+    observations of different episodes are never mixed.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.wrappers import RandomMixupObservationBuffered
+        >>> env = gym.make("CartPole-v1")
+        >>> wrapped_env = RandomMixupObservationBuffered(env, rollout_len=128, noise_rate=0.1, factor=0.3)
+    """
+
+    def __init__(self, env, rollout_len, noise_rate=0.01, factor=0.5, seed=None):
+        """Initializes the :class:`RandomMixupObservationBuffered` wrapper.
+
+        Args:
+            env (gym.Env): The environment to apply the wrapper
+            rollout_len (int): The number of steps of each rollout.
+            noise_rate (float, optional): Probability of applying mixup to each observation of the rollout.
+                Defaults to 0.01.
+            factor (float, optional): The mixup factor (factor * observation + (1 - factor) * last_observation).
+                Defaults to 0.5.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+        """
+        super().__init__(env)
+        self.rollout_len = rollout_len
+        self.noise_rate = noise_rate
+        self.factor = factor
+        self._rng = np.random.default_rng(seed)
+        space = env.observation_space
+        self._floating = np.issubdtype(space.dtype, np.floating)
+        # The first row holds the observation preceding the rollout, which the first step is mixed with
+        self._obs_buf = np.empty((rollout_len + 1,) + space.shape, dtype=space.dtype)
+        self._t = None
+        self._rollouts = collections.deque()
+
+    def reset(self, **kwargs):
+        """Resets the environment, queueing the observations of the unfinished rollout, if any."""
+        self._flush()
+        obs, info = self.env.reset(**kwargs)
+        self._obs_buf[0] = obs
+        self._t = 0
+        return obs, info
+
+    def step(self, action):
+        """Steps the environment, storing the unmodified observation in the rollout buffer."""
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        self._t += 1
+        self._obs_buf[self._t] = obs
+        if self._t == self.rollout_len:
+            self._flush()
+        return obs, reward, terminated, truncated, info
+
+    def _flush(self):
+        if not self._t:
+            return
+
+        rollout = self._obs_buf[1:self._t + 1].copy()
+        last = self._obs_buf[:self._t]
+        mask = self._rng.random(self._t) <= self.noise_rate
+        mixed = self.factor * rollout[mask] + (1 - self.factor) * last[mask]
+        rollout[mask] = mixed if self._floating else np.rint(mixed)
+        self._rollouts.append(rollout)
+
+        self._obs_buf[0] = self._obs_buf[self._t]
+        self._t = 0
+
+    def pop_rollout(self):
+        """Returns the mixed up observations of the oldest queued rollout.
+
+        Returns:
+            np.ndarray: The observations of the rollout, of shape (n, *observation_shape) where n is at most
+                ``rollout_len``, or None if no rollout is queued.
+        """
+        if not self._rollouts:
+            return None
+        return self._rollouts.popleft()
+
+
 class RandomDropoutObservation(gym.ObservationWrapper):
     """Applies dropout to the observations of the environment.
 
@@ -57,7 +410,11 @@ class RandomDropoutObservation(gym.ObservationWrapper):
         >>> wrapped_env = RandomDropoutObservation(env, noise_rate=0.1, p=0.5)
     """
 
-    def __init__(self, env, noise_rate=0.01, p=0.1):
+    MAX_ENUMERATED_ELEMENTS = 16
+
+    noise_rate = _noise_rate_property("observation")
+
+    def __init__(self, env, noise_rate=0.01, p=0.1, seed=None):
         """Initializes the :class:`RandomDropoutObservation` wrapper.
 
         Args:
@@ -65,21 +422,67 @@ class RandomDropoutObservation(gym.ObservationWrapper):
             noise_rate (float, optional): Probability of applying dropout to the observation each step.
                 Defaults to 0.01.
             p (float, optional): The probability of replacing an element of the observation with a 0. Defaults to 0.1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
         """
         super().__init__(env)
+        self._rng = np.random.default_rng(seed)
         self.noise_rate = noise_rate
+
+        shape = env.observation_space.shape
+        self._size = int(np.prod(shape))
+        self._enumerated = self._size <= self.MAX_ENUMERATED_ELEMENTS
+        if self._enumerated:
+            # Small observations only have 2 ** size distinct masks, so they are all enumerated once and each step
+            # picks one according to its probability, drawing a whole block of indices at a time
+            bits = (np.arange(2 ** self._size)[:, None] >> np.arange(self._size)) & 1
+            self._masks = bits.astype(bool).reshape((2 ** self._size,) + shape)
+            self._kept = bits.sum(axis=1)
         self.p = p
 
+    @property
+    def p(self):
+        """The probability of replacing an element of the observation with a 0."""
+        return self._p
+
+    @p.setter
+    def p(self, p):
+        # The masks drawn for the previous p are discarded, so the new p applies from the next step
+        self._p = p
+        if self._enumerated:
+            self._cdf = np.cumsum((1 - p) ** self._kept * p ** (self._size - self._kept))
+            self._mask_index = _NoiseBuffer((), "uniform", self._rng, transform=self._pick_masks)
+        else:
+            self._mask_buffer = _NoiseBuffer(
+                self.observation_space.shape, "uniform", self._rng, dtype=np.float32, transform=self._threshold
+            )
+
+    def _pick_masks(self, block):
+        # Clipped so that rounding in the cumulative sum can never pick an index past the last mask
+        return np.minimum(np.searchsorted(self._cdf, block, side="right"), len(self._cdf) - 1)
+
+    def _threshold(self, block):
+        return block >= self._p
+
     def observation(self, observation):
         """Returns the potentially modified observation."""
-        if (np.random.rand() <= self.noise_rate):
-            observation *= np.random.binomial(np.ones(observation.shape).astype(int), p=(1 - self.p))
+        if self._gate.next():
+            observation = self._noisy_observation(observation)
+        return observation
+
+    def _noisy_observation(self, observation):
+        if self._enumerated:
+            observation *= self._masks[self._mask_index.next()]
+        else:
+            observation *= self._mask_buffer.next()
         return observation
 
 
 class RandomNormalNoisyObservation(gym.ObservationWrapper):
     """Adds random Normal noise to the observations of the environment.
 
+    For uint8 observations, such as images, ``loc`` and ``scale`` are in intensity levels and the noisy observation is
+    rounded and saturated to [0, 255].
+
     Example:
         >>> import gymnasium as gym
         >>> from noisyenv.wrappers import RandomNormalNoisyObservation
@@ -87,7 +490,9 @@ class RandomNormalNoisyObservation(gym.ObservationWrapper):
         >>> wrapped_env = RandomNormalNoisyObservation(env, noise_rate=0.1, loc=0.0, scale=0.1)
     """
 
-    def __init__(self, env, noise_rate=0.01, loc=0.0, scale=0.01):
+    noise_rate = _noise_rate_property("observation")
+
+    def __init__(self, env, noise_rate=0.01, loc=0.0, scale=0.01, seed=None):
         """Initializes the :class:`RandomNormalNoisyObservation` wrapper.
 
         Args:
@@ -98,18 +503,69 @@ class RandomNormalNoisyObservation(gym.ObservationWrapper):
                 Defaults to 0.0.
             scale (float, optional): Standard deviation (spread or "width") of the noise distribution.
                 Must be non-negative. Defaults to 0.01.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
         """
         super().__init__(env)
+        self._rng = np.random.default_rng(seed)
         self.noise_rate = noise_rate
-        self.loc = loc
-        self.scale = scale
+        self._loc = loc
+        self._scale = scale
+
+        space = env.observation_space
+        self._uint8 = space.dtype == np.uint8
+        if self._uint8:
+            # Images stay in 8 bits: the noise is rounded to whole intensity levels once per block and added with
+            # saturation in int16, avoiding a conversion of the observation to floating point
+            self._requantize()
+            self._scratch = np.empty(space.shape, dtype=np.int16)
+            _kernels.warmup(
+                _kernels.add_saturate_uint8, space, np.zeros(space.shape, dtype=np.int16), self._scratch
+            )
+        else:
+            self._noise = _NoiseBuffer(space.shape, "normal", self._rng, dtype=space.dtype)
+            self._scratch = np.empty(self._noise.shape, dtype=self._noise.dtype)
+            _kernels.warmup(_kernels.add_affine, space, np.zeros_like(self._scratch), loc, scale, self._scratch)
+
+    @property
+    def loc(self):
+        """Mean ("centre") of the noise distribution."""
+        return self._loc
+
+    @loc.setter
+    def loc(self, loc):
+        self._loc = loc
+        self._requantize()
+
+    @property
+    def scale(self):
+        """Standard deviation (spread or "width") of the noise distribution."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale):
+        self._scale = scale
+        self._requantize()
+
+    def _requantize(self):
+        # The uint8 noise is quantized a block at a time, so the block drawn for the previous loc and scale is
+        # discarded for the new ones to apply from the next step
+        if self._uint8:
+            self._noise = _NoiseBuffer(self.observation_space.shape, "normal", self._rng, transform=self._quantize)
+
+    def _quantize(self, block):
+        return np.clip(np.rint(self._loc + self._scale * block), -255, 255).astype(np.int16)
 
     def observation(self, observation):
         """Returns the potentially modified observation."""
-        if np.random.rand() <= self.noise_rate:
-            observation += np.random.normal(loc=self.loc, scale=self.scale, size=observation.shape)
+        if self._gate.next():
+            observation = self._noisy_observation(observation)
         return observation
 
+    def _noisy_observation(self, observation):
+        if self._uint8:
+            return _kernels.add_saturate_uint8(observation, self._noise.next(), self._scratch)
+        return _kernels.add_affine(observation, self._noise.next(), self._loc, self._scale, self._scratch)
+
 
 class RandomUniformNoisyObservation(gym.ObservationWrapper):
     """Adds random Uniform noise to the observations of the environment.
@@ -121,7 +577,11 @@ class RandomUniformNoisyObservation(gym.ObservationWrapper):
         >>> wrapped_env = RandomUniformNoisyObservation(env, noise_rate=0.1, low=-0.1, high=0.1)
     """
 
-    def __init__(self, env, noise_rate=0.01, low=-0.1, high=0.1):
+    noise_rate = _noise_rate_property("observation")
+    low = _bound_property("low")
+    high = _bound_property("high")
+
+    def __init__(self, env, noise_rate=0.01, low=-0.1, high=0.1, seed=None):
         """Initializes the :class:`RandomUniformNoisyObservation` wrapper.
 
         Args:
@@ -132,18 +592,30 @@ class RandomUniformNoisyObservation(gym.ObservationWrapper):
                 Defaults to -0.1.
             high (float, optional): Upper boundary of the noise distribution.
                 Defaults to 0.1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
         """
         super().__init__(env)
+        self._rng = np.random.default_rng(seed)
         self.noise_rate = noise_rate
-        self.low = low
-        self.high = high
+        self._low = low
+        self._high = high
+        self._width = high - low
+        self._noise = _NoiseBuffer(env.observation_space.shape, "uniform", self._rng, dtype=env.observation_space.dtype)
+        self._scratch = np.empty(self._noise.shape, dtype=self._noise.dtype)
+        _kernels.warmup(
+            _kernels.add_affine, env.observation_space, np.zeros_like(self._scratch), self._low, self._width,
+            self._scratch
+        )
 
     def observation(self, observation):
         """Returns the potentially modified observation."""
-        if np.random.rand() <= self.noise_rate:
-            observation += np.random.uniform(low=self.low, high=self.high, size=observation.shape)
+        if self._gate.next():
+            observation = self._noisy_observation(observation)
         return observation
 
+    def _noisy_observation(self, observation):
+        return _kernels.add_affine(observation, self._noise.next(), self._low, self._width, self._scratch)
+
 
 class RandomUniformScaleObservation(gym.ObservationWrapper):
     """Scales the observations by random Uniform noise.
@@ -155,7 +627,11 @@ class RandomUniformScaleObservation(gym.ObservationWrapper):
         >>> wrapped_env = RandomUniformScaleObservation(env, noise_rate=0.1, low=0.9, high=1.1)
     """
 
-    def __init__(self, env, noise_rate=0.01, low=0.9, high=1.1, size=1):
+    noise_rate = _noise_rate_property("observation")
+    low = _bound_property("low")
+    high = _bound_property("high")
+
+    def __init__(self, env, noise_rate=0.01, low=0.9, high=1.1, size=1, seed=None):
         """Initializes the :class:`RandomUniformScaleObservation` wrapper.
 
         Args:
@@ -168,21 +644,198 @@ class RandomUniformScaleObservation(gym.ObservationWrapper):
                 Defaults to 1.1.
             size (int, optional): The number of scaling factors to sample.
                 If None then size is equal to observation.shape. Defaults to 1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
         """
         super().__init__(env)
+        self._rng = np.random.default_rng(seed)
         self.noise_rate = noise_rate
-        self.low = low
-        self.high = high
+        self._low = low
+        self._high = high
+        self._width = high - low
         self.size = size
+        _kernels.warmup(
+            _kernels.multiply_affine, env.observation_space, np.zeros_like(self._scratch), self._low, self._width,
+            self._scratch
+        )
 
     def observation(self, observation):
         """Returns the potentially modified observation."""
-        if np.random.rand() <= self.noise_rate:
-            if self.size is None:
-                size = observation.shape
-            else:
-                size = self.size
-            observation *= np.random.uniform(low=self.low, high=self.high, size=size)
+        if self._gate.next():
+            observation = self._noisy_observation(observation)
+        return observation
+
+    @property
+    def size(self):
+        """The number of scaling factors to sample, or None for one per element of the observation."""
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        # The noise and its scratch buffer are shaped by size, so they are rebuilt for the new one
+        self._size = size
+        space = self.observation_space
+        self._noise = _NoiseBuffer(space.shape if size is None else size, "uniform", self._rng, dtype=space.dtype)
+        self._scratch = np.empty(self._noise.shape, dtype=self._noise.dtype)
+
+    def _noisy_observation(self, observation):
+        return _kernels.multiply_affine(observation, self._noise.next(), self._low, self._width, self._scratch)
+
+
+def _merge_arguments(name, arguments, defaults):
+    """Returns a read-only mapping of the arguments of a transform merged with its defaults, or None if not given.
+
+    Raises:
+        ValueError: If the arguments contain a key that is not one of the defaults.
+    """
+    if arguments is None:
+        return None
+    unknown = set(arguments) - set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown arguments for {name}: {sorted(unknown)}, expected a subset of {list(defaults)}")
+    return types.MappingProxyType({**defaults, **arguments})
+
+
+class ComposedNoisyObservation(gym.ObservationWrapper):
+    """Applies several of the observation noise transforms in a single wrapper.
+
+    The transforms are applied in the order scale, uniform noise, Normal noise, dropout and mixup, which gives the
+    same observations as stacking :class:`RandomUniformScaleObservation`, :class:`RandomUniformNoisyObservation`,
+    :class:`RandomNormalNoisyObservation`, :class:`RandomDropoutObservation` and :class:`RandomMixupObservation` in
+    that order. All the gates are drawn together from one random number generator and the noise is applied in place
+    to the observation in a single method, instead of one wrapper call per transform each step.
+    Observations must have a floating point dtype.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from noisyenv.wrappers import ComposedNoisyObservation
+        >>> env = gym.make("CartPole-v1")
+        >>> wrapped_env = ComposedNoisyObservation(
+        ...     env, normal={"noise_rate": 0.1, "scale": 0.1}, dropout={"noise_rate": 0.1, "p": 0.5}
+        ... )
+    """
+
+    def __init__(self, env, *, scale=None, uniform_noise=None, normal=None, dropout=None, mixup=None, seed=None):
+        """Initializes the :class:`ComposedNoisyObservation` wrapper.
+
+        Each transform is configured by a dict of the keyword arguments of the corresponding wrapper, with missing
+        arguments taking that wrapper's defaults. Transforms left as None are not applied. The merged arguments are
+        stored as read-only mappings, since they are fixed once the wrapper is built.
+
+        Args:
+            env (gym.Env): The environment to apply the wrapper
+            scale (dict, optional): Arguments of :class:`RandomUniformScaleObservation`. Defaults to None.
+            uniform_noise (dict, optional): Arguments of :class:`RandomUniformNoisyObservation`. Defaults to None.
+            normal (dict, optional): Arguments of :class:`RandomNormalNoisyObservation`. Defaults to None.
+            dropout (dict, optional): Arguments of :class:`RandomDropoutObservation`. Defaults to None.
+            mixup (dict, optional): Arguments of :class:`RandomMixupObservation`. Defaults to None.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
+
+        Raises:
+            ValueError: If the observations are not floating point, or a dict contains an unknown argument.
+        """
+        super().__init__(env)
+        space = env.observation_space
+        if not np.issubdtype(space.dtype, np.floating):
+            raise ValueError(f"ComposedNoisyObservation requires floating point observations, got {space.dtype}")
+        self._rng = np.random.default_rng(seed)
+
+        self.scale = _merge_arguments("scale", scale, {"noise_rate": 0.01, "low": 0.9, "high": 1.1, "size": 1})
+        self.uniform_noise = _merge_arguments(
+            "uniform_noise", uniform_noise, {"noise_rate": 0.01, "low": -0.1, "high": 0.1}
+        )
+        self.normal = _merge_arguments("normal", normal, {"noise_rate": 0.01, "loc": 0.0, "scale": 0.01})
+        self.dropout = _merge_arguments("dropout", dropout, {"noise_rate": 0.01, "p": 0.1})
+        self.mixup = _merge_arguments("mixup", mixup, {"noise_rate": 0.01, "factor": 0.5})
+
+        # The arguments read each step are cached as attributes, as in the standalone wrappers
+        transforms = []
+        if self.scale is not None:
+            size = self.scale["size"]
+            self._scale_noise = _NoiseBuffer(
+                space.shape if size is None else size, "uniform", self._rng, dtype=space.dtype
+            )
+            self._scale_scratch = np.empty(self._scale_noise.shape, dtype=self._scale_noise.dtype)
+            self._scale_low = self.scale["low"]
+            self._scale_width = self.scale["high"] - self.scale["low"]
+            transforms.append((self._apply_scale, self.scale["noise_rate"]))
+        if self.uniform_noise is not None:
+            self._uniform_noise = _NoiseBuffer(space.shape, "uniform", self._rng, dtype=space.dtype)
+            self._uniform_low = self.uniform_noise["low"]
+            self._uniform_width = self.uniform_noise["high"] - self.uniform_noise["low"]
+            transforms.append((self._apply_uniform_noise, self.uniform_noise["noise_rate"]))
+        if self.normal is not None:
+            self._normal_noise = _NoiseBuffer(space.shape, "normal", self._rng, dtype=space.dtype)
+            self._normal_loc = self.normal["loc"]
+            self._normal_scale = self.normal["scale"]
+            transforms.append((self._apply_normal, self.normal["noise_rate"]))
+        if self.dropout is not None:
+            self._mask = np.empty(space.shape, dtype=bool)
+            self._dropout_p = self.dropout["p"]
+            transforms.append((self._apply_dropout, self.dropout["noise_rate"]))
+        self._transforms = [transform for transform, _ in transforms]
+        self._mixup_idx = len(transforms)
+        if self.mixup is not None:
+            self._mixup_factor = self.mixup["factor"]
+            self._mixup_one_minus_factor = 1 - self.mixup["factor"]
+            transforms.append((None, self.mixup["noise_rate"]))
+        self._last_observation = None if self.mixup is None else np.empty(space.shape, dtype=space.dtype)
+        self._has_last = False
+        self._scratch = np.empty(space.shape, dtype=np.float32 if space.dtype == np.float32 else np.float64)
+        self._rates = np.array([rate for _, rate in transforms], dtype=np.float64)
+        self._gate = _GateBuffer(self._rates, self._rng)
+
+    def reset(self, **kwargs):
+        """Resets the environment, returning a potentially modified observation.
+
+        As with :class:`RandomMixupObservation`, mixup is not applied to the first observation of an episode.
+        """
+        obs, info = self.env.reset(**kwargs)
+        obs = self._apply_transforms(obs, self._gate.next())
+        if self.mixup is not None:
+            np.copyto(self._last_observation, obs)
+            self._has_last = True
+        return obs, info
+
+    def _apply_scale(self, observation):
+        return _kernels.multiply_affine(
+            observation, self._scale_noise.next(), self._scale_low, self._scale_width, self._scale_scratch
+        )
+
+    def _apply_uniform_noise(self, observation):
+        return _kernels.add_affine(
+            observation, self._uniform_noise.next(), self._uniform_low, self._uniform_width, self._scratch
+        )
+
+    def _apply_normal(self, observation):
+        return _kernels.add_affine(
+            observation, self._normal_noise.next(), self._normal_loc, self._normal_scale, self._scratch
+        )
+
+    def _apply_dropout(self, observation):
+        uniform = self._rng.random(dtype=self._scratch.dtype, out=self._scratch)
+        np.greater_equal(uniform, self._dropout_p, out=self._mask)
+        observation *= self._mask
+        return observation
+
+    def _apply_transforms(self, observation, fire):
+        for transform, fired in zip(self._transforms, fire):
+            if fired:
+                observation = transform(observation)
+        return observation
+
+    def observation(self, observation):
+        """Returns the potentially modified observation."""
+        fire = self._gate.next()
+        observation = self._apply_transforms(observation, fire)
+
+        if self._has_last:
+            if fire[self._mixup_idx]:
+                observation = _kernels.mixup(
+                    observation, self._last_observation, self._mixup_factor, self._mixup_one_minus_factor,
+                    self._scratch
+                )
+            np.copyto(self._last_observation, observation)
+
         return observation
 
 
@@ -196,7 +849,11 @@ class RandomUniformScaleReward(gym.RewardWrapper):
         >>> wrapped_env = RandomUniformScaleReward(env, noise_rate=0.1, low=0.9, high=1.1)
     """
 
-    def __init__(self, env, noise_rate=0.01, low=0.9, high=1.1):
+    noise_rate = _noise_rate_property("reward")
+    low = _bound_property("low")
+    high = _bound_property("high")
+
+    def __init__(self, env, noise_rate=0.01, low=0.9, high=1.1, seed=None):
         """Initializes the :class:`RandomUniformScaleReward` wrapper.
 
         Args:
@@ -207,18 +864,25 @@ class RandomUniformScaleReward(gym.RewardWrapper):
                 Defaults to 0.9.
             high (float, optional): Upper boundary of the noise distribution.
                 Defaults to 1.1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
         """
         super().__init__(env)
+        self._rng = np.random.default_rng(seed)
         self.noise_rate = noise_rate
-        self.low = low
-        self.high = high
+        self._low = low
+        self._high = high
+        self._width = high - low
+        self._noise = _NoiseBuffer((), "uniform", self._rng)
 
     def reward(self, reward):
         """Returns the potentially modified reward."""
-        if np.random.rand() <= self.noise_rate:
-            reward *= np.random.uniform(self.low, self.high)
+        if self._gate.next():
+            return self._noisy_reward(reward)
         return reward
 
+    def _noisy_reward(self, reward):
+        return reward * (self._low + self._width * self._noise.next())
+
 
 class RandomUniformNoisyReward(gym.RewardWrapper):
     """Adds random Uniform noise to the rewards.
@@ -230,7 +894,11 @@ class RandomUniformNoisyReward(gym.RewardWrapper):
         >>> wrapped_env = RandomUniformNoisyReward(env, noise_rate=0.1, low=-0.1, high=0.1)
     """
 
-    def __init__(self, env, noise_rate=0.01, low=-0.01, high=0.01):
+    noise_rate = _noise_rate_property("reward")
+    low = _bound_property("low")
+    high = _bound_property("high")
+
+    def __init__(self, env, noise_rate=0.01, low=-0.01, high=0.01, seed=None):
         """Initializes the :class:`RandomUniformNoisyReward` wrapper.
 
         Args:
@@ -241,18 +909,25 @@ class RandomUniformNoisyReward(gym.RewardWrapper):
                 Defaults to -0.1.
             high (float, optional): Upper boundary of the noise distribution.
                 Defaults to 0.1.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
         """
         super().__init__(env)
+        self._rng = np.random.default_rng(seed)
         self.noise_rate = noise_rate
-        self.low = low
-        self.high = high
+        self._low = low
+        self._high = high
+        self._width = high - low
+        self._noise = _NoiseBuffer((), "uniform", self._rng)
 
     def reward(self, reward):
         """Returns the potentially modified reward."""
-        if np.random.rand() <= self.noise_rate:
-            reward += np.random.uniform(self.low, self.high)
+        if self._gate.next():
+            return self._noisy_reward(reward)
         return reward
 
+    def _noisy_reward(self, reward):
+        return reward + (self._low + self._width * self._noise.next())
+
 
 class RandomNormalNoisyReward(gym.RewardWrapper):
     """Adds random Normal noise to the rewards.
@@ -264,7 +939,9 @@ class RandomNormalNoisyReward(gym.RewardWrapper):
         >>> wrapped_env = RandomNormalNoisyReward(env, noise_rate=0.1, scale=0.1)
     """
 
-    def __init__(self, env, noise_rate=0.01, loc=0.0, scale=0.01):
+    noise_rate = _noise_rate_property("reward")
+
+    def __init__(self, env, noise_rate=0.01, loc=0.0, scale=0.01, seed=None):
         """Initializes the :class:`RandomNormalNoisyReward` wrapper.
 
         Args:
@@ -275,14 +952,20 @@ class RandomNormalNoisyReward(gym.RewardWrapper):
                 Defaults to 0.0.
             scale (float, optional): Standard deviation (spread or "width") of the noise distribution.
                 Must be non-negative. Defaults to 0.01.
+            seed (int, optional): Seed for the random number generator of the wrapper. Defaults to None.
         """
         super().__init__(env)
+        self._rng = np.random.default_rng(seed)
         self.noise_rate = noise_rate
         self.loc = loc
         self.scale = scale
+        self._noise = _NoiseBuffer((), "normal", self._rng)
 
     def reward(self, reward):
         """Returns the potentially modified reward."""
-        if np.random.rand() <= self.noise_rate:
-            reward += np.random.normal(self.loc, self.scale)
+        if self._gate.next():
+            return self._noisy_reward(reward)
         return reward
+
+    def _noisy_reward(self, reward):
+        return reward + (self.loc + self.scale * self._noise.next())
@@ -17,6 +17,10 @@ setup(
         'gymnasium>=0.26.1',
         'numpy>=1.21.6'
     ],
+    extras_require={
+        'numba': ['numba>=0.56'],
+        'jax': ['jax>=0.4'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
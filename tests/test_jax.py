@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+
+try:
+    import jax
+    import jax.numpy as jnp
+    from noisyenv import jax as noisy_jax
+except ImportError:
+    jax = None
+
+SEED = 333
+
+
+class CounterEnv:
+    """Jittable functional environment whose observation counts the steps of the episode."""
+
+    def reset(self, key, params=None):
+        return jnp.zeros(3), jnp.array(0)
+
+    def step(self, key, state, action, params=None):
+        state = state + 1
+        done = state == 4
+        # Resets itself at the end of the episode, returning the first observation of the next one
+        state = jnp.where(done, 0, state)
+        return jnp.full(3, state, dtype=jnp.float32), state, 1.0, done, {}
+
+
+@unittest.skipIf(jax is None, "JAX is not installed")
+class TestWrap(unittest.TestCase):
+
+    def test_no_noise(self):
+        reset, step = noisy_jax.wrap(CounterEnv(), [
+            noisy_jax.mixup(0.0), noisy_jax.dropout(0.0), noisy_jax.normal_noise(0.0), noisy_jax.uniform_noise(0.0),
+            noisy_jax.uniform_scale(0.0)
+        ])
+        key = jax.random.PRNGKey(SEED)
+        obs, state = reset(key)
+        np.testing.assert_array_equal(obs, 0.0)
+        for i in range(1, 4):
+            key, subkey = jax.random.split(key)
+            obs, state, reward, done, _ = step(subkey, state, 0)
+            np.testing.assert_array_equal(obs, float(i))
+
+    def test_seed(self):
+        reset, step = noisy_jax.wrap(CounterEnv(), [noisy_jax.normal_noise(0.5, scale=1.0)])
+        key = jax.random.PRNGKey(SEED)
+        obs1, state1 = reset(key)
+        obs2, state2 = reset(key)
+        np.testing.assert_array_equal(obs1, obs2)
+        np.testing.assert_array_equal(step(key, state1, 0)[0], step(key, state2, 0)[0])
+
+    def test_transforms(self):
+        key = jax.random.PRNGKey(SEED)
+        obs = jnp.full(3, 2.0)
+        last_obs = jnp.zeros(3)
+        np.testing.assert_allclose(noisy_jax.mixup(1.0, factor=0.25)(key, obs, last_obs), 0.5)
+        np.testing.assert_array_equal(noisy_jax.dropout(1.0, p=1.0)(key, obs, last_obs), 0.0)
+        np.testing.assert_allclose(noisy_jax.normal_noise(1.0, loc=1.0, scale=0.0)(key, obs, last_obs), 3.0)
+        np.testing.assert_allclose(noisy_jax.uniform_noise(1.0, low=1.0, high=1.0)(key, obs, last_obs), 3.0)
+        np.testing.assert_allclose(noisy_jax.uniform_scale(1.0, low=2.0, high=2.0)(key, obs, last_obs), 4.0)
+
+    def test_mixup(self):
+        reset, step = noisy_jax.wrap(CounterEnv(), [noisy_jax.mixup(1.0, factor=0.5)])
+        key = jax.random.PRNGKey(SEED)
+        obs, state = reset(key)
+        expected = [0.5, 1.25, 2.125, 0.0]
+        for i in range(4):
+            obs, state, reward, done, _ = step(key, state, 0)
+            # The first observation of the next episode is not mixed with the previous episode
+            np.testing.assert_allclose(obs, expected[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from noisyenv import _kernels
+
+
+class TestKernels(unittest.TestCase):
+
+    def test_mixup(self):
+        observation = np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
+        last_observation = np.array([3.0, 2.0, 1.0, 0.0], dtype=np.float32)
+        mixed = _kernels.mixup(observation, last_observation, 0.25, 0.75, np.empty(4, dtype=np.float32))
+        self.assertIs(mixed, observation)
+        np.testing.assert_almost_equal(mixed, [2.5, 2.0, 1.5, 1.0])
+        self.assertEqual(mixed.dtype, np.float32)
+
+    def test_mixup_uint8(self):
+        observation = np.array([[0, 255], [100, 7]], dtype=np.uint8)
+        last_observation = np.array([[255, 0], [50, 9]], dtype=np.uint8)
+        scratch, last_scratch = np.empty((2, 2), dtype=np.uint16), np.empty((2, 2), dtype=np.uint16)
+        mixed = _kernels.mixup_uint8(
+            observation, last_observation, np.uint16(128), np.uint16(128), scratch, last_scratch
+        )
+        self.assertIs(mixed, observation)
+        self.assertEqual(mixed.dtype, np.uint8)
+        np.testing.assert_array_equal(mixed, [[128, 128], [75, 8]])
+
+        mixed = _kernels.mixup_uint8(
+            observation, last_observation, np.uint16(256), np.uint16(0), scratch, last_scratch
+        )
+        np.testing.assert_array_equal(mixed, [[128, 128], [75, 8]])
+
+    def test_add_affine(self):
+        observation = np.ones((2, 3), dtype=np.float32)
+        sample = np.full((2, 3), 0.5)
+        result = _kernels.add_affine(observation, sample, 1.0, 2.0, np.empty((2, 3)))
+        self.assertIs(result, observation)
+        np.testing.assert_almost_equal(observation, np.full((2, 3), 3.0))
+
+    def test_add_saturate_uint8(self):
+        observation = np.array([[0, 255], [100, 7]], dtype=np.uint8)
+        noise = np.array([[-5, 5], [10, -10]], dtype=np.int16)
+        result = _kernels.add_saturate_uint8(observation, noise, np.empty((2, 2), dtype=np.int16))
+        self.assertIs(result, observation)
+        self.assertEqual(result.dtype, np.uint8)
+        np.testing.assert_array_equal(result, [[0, 255], [110, 0]])
+
+    def test_multiply_affine(self):
+        observation = np.ones(4)
+        result = _kernels.multiply_affine(observation, np.full(1, 0.5), 0.5, 2.0, np.empty(1))
+        self.assertIs(result, observation)
+        np.testing.assert_almost_equal(observation, np.full(4, 1.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+import unittest
+import gymnasium as gym
+import numpy as np
+from noisyenv.vector import (
+    VectorRandomMixupObservation, VectorRandomDropoutObservation, VectorRandomNormalNoisyObservation,
+    VectorRandomUniformNoisyObservation, VectorRandomUniformScaleObservation, VectorRandomUniformScaleReward,
+    VectorRandomUniformNoisyReward, VectorRandomNormalNoisyReward
+)
+from tests.test_wrappers import ImageEnv
+
+ENV_ID = 'CartPole-v1'
+NUM_ENVS = 4
+SEED = 333
+
+
+def make_vec():
+    return gym.make_vec(ENV_ID, num_envs=NUM_ENVS, vectorization_mode='sync')
+
+
+class BaseVectorNoiseTest:
+    NoiseClass = None
+
+    def test_no_noise(self):
+        envs = make_vec()
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=0.0)
+        envs.reset(seed=SEED)
+        wrapped_envs.reset(seed=SEED)
+
+        for i in range(10):
+            actions = wrapped_envs.action_space.sample()
+
+            wrapped_obs, wrapped_rewards, wrapped_terminations, wrapped_truncations, _ = wrapped_envs.step(actions)
+            obs, rewards, terminations, truncations, _ = envs.step(actions)
+
+            np.testing.assert_almost_equal(obs, wrapped_obs)
+            np.testing.assert_almost_equal(rewards, wrapped_rewards)
+            np.testing.assert_array_equal(terminations, wrapped_terminations)
+            np.testing.assert_array_equal(truncations, wrapped_truncations)
+
+    def test_seed(self):
+        wrapped_envs1 = self.NoiseClass(make_vec(), noise_rate=0.5, seed=SEED)
+        wrapped_envs2 = self.NoiseClass(make_vec(), noise_rate=0.5, seed=SEED)
+        wrapped_envs1.reset(seed=SEED)
+        wrapped_envs2.reset(seed=SEED)
+
+        for i in range(10):
+            actions = wrapped_envs1.action_space.sample()
+            obs1, rewards1, *_ = wrapped_envs1.step(actions)
+            obs2, rewards2, *_ = wrapped_envs2.step(actions)
+
+            np.testing.assert_array_equal(obs1, obs2)
+            np.testing.assert_array_equal(rewards1, rewards2)
+
+
+class TestVectorRandomMixupObservation(BaseVectorNoiseTest, unittest.TestCase):
+    NoiseClass = VectorRandomMixupObservation
+
+    def test_observation(self):
+        envs = make_vec()
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, factor=0.5)
+        observations1, _ = envs.reset(seed=SEED)
+        wrapped_observations1, _ = wrapped_envs.reset(seed=SEED)
+
+        actions = wrapped_envs.action_space.sample()
+        observations2, *_ = envs.step(actions)
+        wrapped_observations2, *_ = wrapped_envs.step(actions)
+
+        np.testing.assert_array_equal(wrapped_observations1, observations1)
+        np.testing.assert_almost_equal(wrapped_observations2, 0.5 * observations2 + 0.5 * observations1)
+
+    def test_episode_boundary(self):
+        envs = make_vec()
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, factor=0.5)
+        envs.reset(seed=SEED)
+        wrapped_envs.reset(seed=SEED)
+
+        # Pushing the cart in one direction ends the episodes within a few steps
+        actions = np.zeros(NUM_ENVS, dtype=np.int64)
+        done = np.zeros(NUM_ENVS, dtype=bool)
+        boundaries = 0
+        for i in range(30):
+            obs, _, terminations, truncations, _ = envs.step(actions)
+            wrapped_obs, *_ = wrapped_envs.step(actions)
+            np.testing.assert_array_equal(wrapped_obs[done], obs[done])
+            boundaries += done.sum()
+            done = terminations | truncations
+        self.assertGreater(boundaries, 0)
+
+        obs, _ = envs.reset(seed=SEED + 1)
+        wrapped_obs, _ = wrapped_envs.reset(seed=SEED + 1)
+        np.testing.assert_array_equal(wrapped_obs, obs)
+
+    def test_uint8_observation(self):
+        envs = gym.vector.SyncVectorEnv([ImageEnv] * NUM_ENVS)
+        wrapped_envs = self.NoiseClass(gym.vector.SyncVectorEnv([ImageEnv] * NUM_ENVS), noise_rate=1.0, factor=0.25)
+        observations1, _ = envs.reset(seed=SEED)
+        wrapped_envs.reset(seed=SEED)
+
+        actions = np.zeros(NUM_ENVS, dtype=np.int64)
+        observations2, *_ = envs.step(actions)
+        wrapped_observations2, *_ = wrapped_envs.step(actions)
+
+        expected_observations = np.rint(0.25 * observations2 + 0.75 * observations1.astype(float))
+        self.assertEqual(wrapped_observations2.dtype, np.uint8)
+        np.testing.assert_array_equal(wrapped_observations2, expected_observations)
+
+
+class TestVectorRandomDropoutObservation(BaseVectorNoiseTest, unittest.TestCase):
+    NoiseClass = VectorRandomDropoutObservation
+
+    def test_observation(self):
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, p=1.0)
+        wrapped_envs.reset(seed=SEED)
+        for i in range(10):
+            obs, *_ = wrapped_envs.step(wrapped_envs.action_space.sample())
+            np.testing.assert_array_equal(obs, 0.0)
+
+
+class TestVectorRandomNormalNoisyObservation(BaseVectorNoiseTest, unittest.TestCase):
+    NoiseClass = VectorRandomNormalNoisyObservation
+
+    def test_observation(self):
+        envs = make_vec()
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, loc=1.0, scale=0.0)
+        envs.reset(seed=SEED)
+        wrapped_envs.reset(seed=SEED)
+
+        actions = wrapped_envs.action_space.sample()
+        wrapped_obs, wrapped_rewards, *_ = wrapped_envs.step(actions)
+        obs, rewards, *_ = envs.step(actions)
+
+        np.testing.assert_almost_equal(wrapped_obs - obs, 1.0, decimal=6)
+        np.testing.assert_almost_equal(rewards, wrapped_rewards)
+
+
+class TestVectorRandomUniformNoisyObservation(BaseVectorNoiseTest, unittest.TestCase):
+    NoiseClass = VectorRandomUniformNoisyObservation
+
+    def test_observation(self):
+        envs = make_vec()
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, low=1.0, high=1.0)
+        envs.reset(seed=SEED)
+        wrapped_envs.reset(seed=SEED)
+
+        actions = wrapped_envs.action_space.sample()
+        wrapped_obs, wrapped_rewards, *_ = wrapped_envs.step(actions)
+        obs, rewards, *_ = envs.step(actions)
+
+        np.testing.assert_almost_equal(wrapped_obs - obs, 1.0, decimal=6)
+        np.testing.assert_almost_equal(rewards, wrapped_rewards)
+
+
+class TestVectorRandomUniformScaleObservation(BaseVectorNoiseTest, unittest.TestCase):
+    NoiseClass = VectorRandomUniformScaleObservation
+
+    def test_observation(self):
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, low=0.0, high=0.0)
+        wrapped_envs.reset(seed=SEED)
+        obs, *_ = wrapped_envs.step(wrapped_envs.action_space.sample())
+        np.testing.assert_array_equal(obs, 0.0)
+
+        envs = make_vec()
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, low=2.0, high=2.0, size=None)
+        envs.reset(seed=SEED)
+        wrapped_envs.reset(seed=SEED)
+
+        actions = wrapped_envs.action_space.sample()
+        wrapped_obs, *_ = wrapped_envs.step(actions)
+        obs, *_ = envs.step(actions)
+
+        np.testing.assert_almost_equal(wrapped_obs, 2.0 * obs)
+
+
+class TestVectorRandomUniformScaleReward(BaseVectorNoiseTest, unittest.TestCase):
+    NoiseClass = VectorRandomUniformScaleReward
+
+    def test_reward(self):
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, low=0.0, high=0.0)
+        wrapped_envs.reset(seed=SEED)
+        _, rewards, *_ = wrapped_envs.step(wrapped_envs.action_space.sample())
+        np.testing.assert_array_equal(rewards, 0.0)
+
+
+class TestVectorRandomUniformNoisyReward(BaseVectorNoiseTest, unittest.TestCase):
+    NoiseClass = VectorRandomUniformNoisyReward
+
+    def test_reward(self):
+        envs = make_vec()
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, low=1.0, high=1.0)
+        envs.reset(seed=SEED)
+        wrapped_envs.reset(seed=SEED)
+
+        actions = wrapped_envs.action_space.sample()
+        _, wrapped_rewards, *_ = wrapped_envs.step(actions)
+        _, rewards, *_ = envs.step(actions)
+
+        np.testing.assert_almost_equal(wrapped_rewards - rewards, 1.0)
+
+
+class TestVectorRandomNormalNoisyReward(BaseVectorNoiseTest, unittest.TestCase):
+    NoiseClass = VectorRandomNormalNoisyReward
+
+    def test_reward(self):
+        envs = make_vec()
+        wrapped_envs = self.NoiseClass(make_vec(), noise_rate=1.0, loc=1.0, scale=0.0)
+        envs.reset(seed=SEED)
+        wrapped_envs.reset(seed=SEED)
+
+        actions = wrapped_envs.action_space.sample()
+        _, wrapped_rewards, *_ = wrapped_envs.step(actions)
+        _, rewards, *_ = envs.step(actions)
+
+        np.testing.assert_almost_equal(wrapped_rewards - rewards, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,14 +2,31 @@ import unittest
 import gymnasium as gym
 import numpy as np
 from noisyenv.wrappers import (
-    RandomMixupObservation, RandomDropoutObservation, RandomNormalNoisyObservation, RandomUniformNoisyObservation,
-    RandomUniformScaleObservation, RandomUniformScaleReward, RandomUniformNoisyReward, RandomNormalNoisyReward
+    RandomMixupObservation, RandomMixupObservationBuffered, RandomDropoutObservation, RandomNormalNoisyObservation,
+    RandomUniformNoisyObservation, RandomUniformScaleObservation, RandomUniformScaleReward, RandomUniformNoisyReward,
+    RandomNormalNoisyReward, ComposedNoisyObservation, _GateBuffer, _GeometricGate, _NoiseBuffer
 )
 
 ENV_ID = 'CartPole-v1'
 SEED = 333
 
 
+class ImageEnv(gym.Env):
+    """Environment with random uint8 image observations."""
+    observation_space = gym.spaces.Box(0, 255, (8, 8, 3), dtype=np.uint8)
+    action_space = gym.spaces.Discrete(2)
+
+    def _image(self):
+        return self.np_random.integers(0, 256, self.observation_space.shape, dtype=np.uint8)
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        return self._image(), {}
+
+    def step(self, action):
+        return self._image(), 1.0, False, False, {}
+
+
 class BaseNoiseTest:
     NoiseClass = None
 
@@ -31,6 +48,48 @@ class BaseNoiseTest:
             np.testing.assert_almost_equal(terminated, wrapped_terminated)
             np.testing.assert_almost_equal(truncated, wrapped_truncated)
 
+    def test_seed(self):
+        wrapped_env1 = self.NoiseClass(gym.make(ENV_ID), noise_rate=0.5, seed=SEED)
+        wrapped_env2 = self.NoiseClass(gym.make(ENV_ID), noise_rate=0.5, seed=SEED)
+        wrapped_env1.reset(seed=SEED)
+        wrapped_env2.reset(seed=SEED)
+
+        for i in range(10):
+            action = wrapped_env1.action_space.sample()
+            obs1, reward1, *_ = wrapped_env1.step(action)
+            obs2, reward2, *_ = wrapped_env2.step(action)
+
+            np.testing.assert_array_equal(obs1, obs2)
+            np.testing.assert_equal(reward1, reward2)
+
+    def test_deterministic_rate(self):
+        for noise_rate in (0.0, 1.0):
+            wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=noise_rate, seed=SEED)
+            wrapped_env.reset(seed=SEED)
+            countdown = wrapped_env._gate._countdown
+            for i in range(10):
+                wrapped_env.step(wrapped_env.action_space.sample())
+            self.assertEqual(wrapped_env._gate._countdown, countdown)
+
+    def test_set_noise_rate(self):
+        env = gym.make(ENV_ID)
+        wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=0.0, seed=SEED)
+        wrapped_env.noise_rate = 1.0
+        self.assertEqual(wrapped_env.noise_rate, 1.0)
+        env.reset(seed=SEED)
+        wrapped_env.reset(seed=SEED)
+
+        noisy = False
+        for i in range(10):
+            action = wrapped_env.action_space.sample()
+            wrapped_obs, wrapped_reward, *_ = wrapped_env.step(action)
+            obs, reward, *_ = env.step(action)
+            noisy |= not (np.array_equal(obs, wrapped_obs) and reward == wrapped_reward)
+        self.assertTrue(noisy)
+
+        wrapped_env.noise_rate = 0.5
+        self.assertFalse({"observation", "reward"} & set(vars(wrapped_env)))
+
 
 class TestRandomMixupObservation(BaseNoiseTest, unittest.TestCase):
     NoiseClass = RandomMixupObservation
@@ -39,7 +98,8 @@ class TestRandomMixupObservation(BaseNoiseTest, unittest.TestCase):
         wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=0.1, factor=0.3)
         self.assertEqual(wrapped_env.noise_rate, 0.1)
         self.assertEqual(wrapped_env.factor, 0.3)
-        self.assertIsNone(wrapped_env._last_observation)
+        self.assertFalse(wrapped_env._has_last)
+        self.assertEqual(wrapped_env._last_observation.shape, wrapped_env.observation_space.shape)
 
     def test_observation(self):
         env = gym.make(ENV_ID)
@@ -56,6 +116,119 @@ class TestRandomMixupObservation(BaseNoiseTest, unittest.TestCase):
         np.testing.assert_array_equal(wrapped_observation2, expected_observation)
         np.testing.assert_array_equal(wrapped_observation1, observation1)
 
+    def test_set_factor(self):
+        for env_fn in (lambda: gym.make(ENV_ID), ImageEnv):
+            env = env_fn()
+            wrapped_env = self.NoiseClass(env_fn(), noise_rate=1.0, factor=0.5)
+            wrapped_env.factor = 0.75
+            observation1, _ = env.reset(seed=SEED)
+            wrapped_env.reset(seed=SEED)
+
+            observation2, *_ = env.step(0)
+            wrapped_observation2, *_ = wrapped_env.step(0)
+
+            expected_observation = 0.75 * observation2 + 0.25 * observation1.astype(float)
+            np.testing.assert_allclose(wrapped_observation2, expected_observation, atol=0.5, rtol=1e-6)
+
+    def test_last_observation(self):
+        wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, factor=0.5)
+        last_observation = wrapped_env._last_observation
+        wrapped_observation1, *_ = wrapped_env.reset(seed=SEED)
+        wrapped_observation1[:] = 10.0
+        self.assertFalse(np.any(wrapped_env._last_observation == 10.0))
+
+        wrapped_observation2, *_ = wrapped_env.step(wrapped_env.action_space.sample())
+        expected_last_observation = wrapped_observation2.copy()
+        wrapped_observation2[:] = 10.0
+        np.testing.assert_array_equal(wrapped_env._last_observation, expected_last_observation)
+
+        # The first observation of an episode is never mixed with the previous episode
+        env = gym.make(ENV_ID)
+        observation, *_ = env.reset(seed=SEED + 1)
+        wrapped_observation, *_ = wrapped_env.reset(seed=SEED + 1)
+        np.testing.assert_array_equal(wrapped_observation, observation)
+        self.assertIs(wrapped_env._last_observation, last_observation)
+
+    def test_before_reset(self):
+        for noise_rate in (0.5, 1.0):
+            wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=noise_rate, factor=0.5)
+            observation = np.ones(4, dtype=np.float32)
+            np.testing.assert_array_equal(wrapped_env.observation(observation.copy()), observation)
+
+    def test_uint8_observation(self):
+        env = ImageEnv()
+        wrapped_env = self.NoiseClass(ImageEnv(), noise_rate=1.0, factor=0.25)
+        observation1, _ = env.reset(seed=SEED)
+        wrapped_env.reset(seed=SEED)
+
+        observation2, *_ = env.step(0)
+        wrapped_observation2, *_ = wrapped_env.step(0)
+
+        expected_observation = 0.25 * observation2 + 0.75 * observation1.astype(float)
+        self.assertEqual(wrapped_observation2.dtype, np.uint8)
+        np.testing.assert_allclose(wrapped_observation2, expected_observation, atol=0.5)
+
+        for factor in (1.2, -0.1):
+            wrapped_env = self.NoiseClass(ImageEnv(), noise_rate=1.0, factor=factor)
+            wrapped_env.reset(seed=SEED)
+            wrapped_observation2, *_ = wrapped_env.step(0)
+            expected_observation = factor * observation2 + (1 - factor) * observation1.astype(float)
+            np.testing.assert_allclose(wrapped_observation2, expected_observation)
+
+
+class TestRandomMixupObservationBuffered(unittest.TestCase):
+
+    def test_init(self):
+        wrapped_env = RandomMixupObservationBuffered(gym.make(ENV_ID), rollout_len=8, noise_rate=0.1, factor=0.3)
+        self.assertEqual(wrapped_env.rollout_len, 8)
+        self.assertEqual(wrapped_env.noise_rate, 0.1)
+        self.assertEqual(wrapped_env.factor, 0.3)
+        self.assertIsNone(wrapped_env.pop_rollout())
+
+    def test_rollout(self):
+        env = gym.make(ENV_ID)
+        wrapped_env = RandomMixupObservationBuffered(gym.make(ENV_ID), rollout_len=3, noise_rate=1.0, factor=0.5)
+        observations = [env.reset(seed=SEED)[0]]
+        wrapped_observation, _ = wrapped_env.reset(seed=SEED)
+        np.testing.assert_array_equal(wrapped_observation, observations[0])
+
+        for i in range(5):
+            action = wrapped_env.action_space.sample()
+            observations.append(env.step(action)[0])
+            wrapped_observation, *_ = wrapped_env.step(action)
+            np.testing.assert_array_equal(wrapped_observation, observations[-1])
+            if i < 2:
+                self.assertIsNone(wrapped_env.pop_rollout())
+
+        observations = np.array(observations, dtype=np.float64)
+        expected_rollout = 0.5 * observations[1:] + 0.5 * observations[:-1]
+        np.testing.assert_almost_equal(wrapped_env.pop_rollout(), expected_rollout[:3], decimal=6)
+        self.assertIsNone(wrapped_env.pop_rollout())
+
+        # The unfinished rollout is queued on reset, and never mixed with the next episode
+        wrapped_env.reset(seed=SEED + 1)
+        np.testing.assert_almost_equal(wrapped_env.pop_rollout(), expected_rollout[3:], decimal=6)
+        observation, *_ = env.reset(seed=SEED + 1)
+        next_observation, *_ = env.step(0)
+        wrapped_env.step(0)
+        wrapped_env.reset()
+        np.testing.assert_almost_equal(
+            wrapped_env.pop_rollout(), [0.5 * next_observation + 0.5 * observation], decimal=6
+        )
+
+    def test_no_noise(self):
+        env = gym.make(ENV_ID)
+        wrapped_env = RandomMixupObservationBuffered(gym.make(ENV_ID), rollout_len=4, noise_rate=0.0)
+        env.reset(seed=SEED)
+        wrapped_env.reset(seed=SEED)
+
+        observations = []
+        for i in range(4):
+            action = wrapped_env.action_space.sample()
+            observations.append(env.step(action)[0])
+            wrapped_env.step(action)
+        np.testing.assert_array_equal(wrapped_env.pop_rollout(), observations)
+
 
 class TestRandomDropoutObservation(BaseNoiseTest, unittest.TestCase):
     NoiseClass = RandomDropoutObservation
@@ -76,6 +249,21 @@ class TestRandomDropoutObservation(BaseNoiseTest, unittest.TestCase):
             obs, reward, terminated, truncated, info = wrapped_env.step(action)
             np.testing.assert_almost_equal(np.mean(obs), 0.0)
 
+    def test_mask_rate(self):
+        for env_fn in (lambda: gym.make(ENV_ID), ImageEnv):
+            wrapped_env = self.NoiseClass(env_fn(), noise_rate=1.0, p=0.25, seed=SEED)
+            observation, _ = wrapped_env.reset(seed=SEED)
+            dropped = [np.mean(wrapped_env.observation(np.ones_like(observation)) == 0) for i in range(2000)]
+            self.assertAlmostEqual(np.mean(dropped), 0.25, delta=0.02)
+
+    def test_set_p(self):
+        for env_fn in (lambda: gym.make(ENV_ID), ImageEnv):
+            wrapped_env = self.NoiseClass(env_fn(), noise_rate=1.0, p=0.0, seed=SEED)
+            observation, _ = wrapped_env.reset(seed=SEED)
+            wrapped_env.observation(np.ones_like(observation))
+            wrapped_env.p = 1.0
+            np.testing.assert_array_equal(wrapped_env.observation(np.ones_like(observation)), 0)
+
 
 class TestRandomNormalNoisyObservation(BaseNoiseTest, unittest.TestCase):
     NoiseClass = RandomNormalNoisyObservation
@@ -103,6 +291,39 @@ class TestRandomNormalNoisyObservation(BaseNoiseTest, unittest.TestCase):
         np.testing.assert_almost_equal(terminated, wrapped_terminated)
         np.testing.assert_almost_equal(truncated, wrapped_truncated)
 
+    def test_uint8_observation(self):
+        env = ImageEnv()
+        wrapped_env = self.NoiseClass(ImageEnv(), noise_rate=1.0, loc=10.4, scale=0.0)
+        env.reset(seed=SEED)
+        wrapped_env.reset(seed=SEED)
+
+        obs, *_ = env.step(0)
+        wrapped_obs, *_ = wrapped_env.step(0)
+
+        self.assertEqual(wrapped_obs.dtype, np.uint8)
+        np.testing.assert_array_equal(wrapped_obs, np.minimum(obs.astype(int) + 10, 255))
+
+        wrapped_env = self.NoiseClass(ImageEnv(), noise_rate=1.0, loc=0.0, scale=300.0)
+        wrapped_env.reset(seed=SEED)
+        wrapped_obs, *_ = wrapped_env.step(0)
+        self.assertEqual(wrapped_obs.dtype, np.uint8)
+        self.assertTrue(np.any(wrapped_obs == 0) and np.any(wrapped_obs == 255))
+
+    def test_set_loc(self):
+        for env_fn in (lambda: gym.make(ENV_ID), ImageEnv):
+            env = env_fn()
+            wrapped_env = self.NoiseClass(env_fn(), noise_rate=1.0, loc=0.0, scale=0.0)
+            wrapped_env.reset(seed=SEED)
+            wrapped_env.step(0)
+            wrapped_env.loc = 10.0
+            wrapped_env.scale = 0.0
+            env.reset(seed=SEED)
+            env.step(0)
+
+            obs, *_ = env.step(0)
+            wrapped_obs, *_ = wrapped_env.step(0)
+            np.testing.assert_allclose(wrapped_obs, np.minimum(obs.astype(float) + 10.0, 255), rtol=1e-6)
+
 
 class TestRandomUniformNoisyObservation(BaseNoiseTest, unittest.TestCase):
     NoiseClass = RandomUniformNoisyObservation
@@ -114,6 +335,16 @@ class TestRandomUniformNoisyObservation(BaseNoiseTest, unittest.TestCase):
         np.testing.assert_equal(wrapped_env.low, -1.0)
         np.testing.assert_equal(wrapped_env.high, 1.0)
 
+    def test_set_bounds(self):
+        env = gym.make(ENV_ID)
+        wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=0.0, high=0.0)
+        wrapped_env.low = wrapped_env.high = 1.0
+        env.reset(seed=SEED)
+        wrapped_env.reset(seed=SEED)
+        wrapped_obs, *_ = wrapped_env.step(0)
+        obs, *_ = env.step(0)
+        np.testing.assert_almost_equal(wrapped_obs - obs, 1.0, decimal=6)
+
     def test_observation(self):
         env = gym.make(ENV_ID)
         wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=1.0, high=1.0)
@@ -141,6 +372,23 @@ class TestRandomUniformScaleObservation(BaseNoiseTest, unittest.TestCase):
         np.testing.assert_equal(wrapped_env.low, -1.0)
         np.testing.assert_equal(wrapped_env.high, 1.0)
 
+    def test_set_bounds(self):
+        env = gym.make(ENV_ID)
+        wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=1.0, high=1.0)
+        wrapped_env.low = wrapped_env.high = 2.0
+        env.reset(seed=SEED)
+        wrapped_env.reset(seed=SEED)
+        wrapped_obs, *_ = wrapped_env.step(0)
+        obs, *_ = env.step(0)
+        np.testing.assert_almost_equal(wrapped_obs, 2.0 * obs)
+
+    def test_set_size(self):
+        wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=0.5, high=1.5, size=1)
+        wrapped_env.size = None
+        self.assertIsNone(wrapped_env.size)
+        observation = np.ones(4, dtype=np.float32)
+        self.assertEqual(len(np.unique(wrapped_env.observation(observation))), 4)
+
     def test_observation(self):
         env = gym.make(ENV_ID)
         wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=0.0, high=0.0)
@@ -179,6 +427,13 @@ class TestRandomUniformScaleReward(BaseNoiseTest, unittest.TestCase):
         np.testing.assert_equal(wrapped_env.low, -1.0)
         np.testing.assert_equal(wrapped_env.high, 1.0)
 
+    def test_set_bounds(self):
+        wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=1.0, high=1.0)
+        wrapped_env.low = wrapped_env.high = 5.0
+        wrapped_env.reset(seed=SEED)
+        _, reward, *_ = wrapped_env.step(0)
+        self.assertEqual(reward, 5.0)
+
     def test_observation(self):
         env = gym.make(ENV_ID)
         wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=0.0, high=0.0)
@@ -217,6 +472,13 @@ class TestRandomUniformNoisyReward(BaseNoiseTest, unittest.TestCase):
         np.testing.assert_equal(wrapped_env.low, -1.0)
         np.testing.assert_equal(wrapped_env.high, 1.0)
 
+    def test_set_bounds(self):
+        wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=0.0, high=0.0)
+        wrapped_env.low = wrapped_env.high = 5.0
+        wrapped_env.reset(seed=SEED)
+        _, reward, *_ = wrapped_env.step(0)
+        self.assertEqual(reward, 6.0)
+
     def test_observation(self):
         env = gym.make(ENV_ID)
         wrapped_env = self.NoiseClass(gym.make(ENV_ID), noise_rate=1.0, low=0.0, high=0.0)
@@ -272,5 +534,134 @@ class TestRandomNormalNoisyReward(BaseNoiseTest, unittest.TestCase):
         np.testing.assert_almost_equal(truncated, wrapped_truncated)
 
 
+class TestComposedNoisyObservation(unittest.TestCase):
+
+    def test_init(self):
+        wrapped_env = ComposedNoisyObservation(gym.make(ENV_ID), normal={"scale": 0.5}, mixup={"noise_rate": 0.1})
+        self.assertIsNone(wrapped_env.scale)
+        self.assertEqual(wrapped_env.normal, {"noise_rate": 0.01, "loc": 0.0, "scale": 0.5})
+        self.assertEqual(wrapped_env.mixup, {"noise_rate": 0.1, "factor": 0.5})
+        np.testing.assert_array_equal(wrapped_env._rates, [0.01, 0.1])
+
+        with self.assertRaises(ValueError):
+            ComposedNoisyObservation(ImageEnv(), normal={})
+        with self.assertRaises(ValueError):
+            ComposedNoisyObservation(gym.make(ENV_ID), normal={"nosie_rate": 1.0})
+        with self.assertRaises(ValueError):
+            ComposedNoisyObservation(gym.make(ENV_ID), mixup={"seed": SEED})
+        with self.assertRaises(TypeError):
+            wrapped_env.normal["scale"] = 1.0
+
+    def test_no_noise(self):
+        env = gym.make(ENV_ID)
+        wrapped_env = ComposedNoisyObservation(
+            gym.make(ENV_ID), scale={"noise_rate": 0.0}, uniform_noise={"noise_rate": 0.0},
+            normal={"noise_rate": 0.0}, dropout={"noise_rate": 0.0}, mixup={"noise_rate": 0.0}
+        )
+        env.reset(seed=SEED)
+        wrapped_env.reset(seed=SEED)
+
+        for i in range(10):
+            action = wrapped_env.action_space.sample()
+            wrapped_obs, *_ = wrapped_env.step(action)
+            obs, *_ = env.step(action)
+            np.testing.assert_almost_equal(obs, wrapped_obs)
+
+    def test_observation(self):
+        env = gym.make(ENV_ID)
+        wrapped_env = ComposedNoisyObservation(
+            gym.make(ENV_ID), scale={"noise_rate": 1.0, "low": 2.0, "high": 2.0},
+            uniform_noise={"noise_rate": 1.0, "low": 0.5, "high": 0.5},
+            normal={"noise_rate": 1.0, "loc": 1.0, "scale": 0.0}, mixup={"noise_rate": 1.0, "factor": 0.5}
+        )
+        observation1, *_ = env.reset(seed=SEED)
+        wrapped_observation1, *_ = wrapped_env.reset(seed=SEED)
+
+        action = wrapped_env.action_space.sample()
+        observation2, *_ = env.step(action)
+        wrapped_observation2, *_ = wrapped_env.step(action)
+
+        expected_observation1 = 2.0 * observation1 + 1.5
+        expected_observation2 = 0.5 * (2.0 * observation2 + 1.5) + 0.5 * expected_observation1
+        np.testing.assert_almost_equal(wrapped_observation1, expected_observation1, decimal=6)
+        np.testing.assert_almost_equal(wrapped_observation2, expected_observation2, decimal=6)
+
+        wrapped_env = ComposedNoisyObservation(gym.make(ENV_ID), dropout={"noise_rate": 1.0, "p": 1.0})
+        wrapped_env.reset(seed=SEED)
+        wrapped_obs, *_ = wrapped_env.step(action)
+        np.testing.assert_array_equal(wrapped_obs, 0.0)
+
+
+class TestGateBuffer(unittest.TestCase):
+
+    def test_next(self):
+        never = _GateBuffer(0.0, np.random.default_rng(SEED), block=8)
+        always = _GateBuffer(1.0, np.random.default_rng(SEED), block=8)
+        for i in range(20):
+            self.assertFalse(never.next())
+            self.assertTrue(always.next())
+
+    def test_multiple_rates(self):
+        gate = _GateBuffer(np.array([0.0, 1.0, 0.0]), np.random.default_rng(SEED), block=8)
+        for i in range(20):
+            self.assertEqual(gate.next(), [False, True, False])
+
+    def test_refill(self):
+        gate = _GateBuffer(0.5, np.random.default_rng(SEED), block=8)
+        rng = np.random.default_rng(SEED)
+        rng.random(8)
+        expected = (rng.random(8) <= 0.5).tolist()
+        for i in range(8):
+            gate.next()
+        self.assertEqual([gate.next() for i in range(8)], expected)
+
+
+class TestGeometricGate(unittest.TestCase):
+
+    def test_next(self):
+        never = _GeometricGate(0.0, np.random.default_rng(SEED), block=8)
+        always = _GeometricGate(1.0, np.random.default_rng(SEED), block=8)
+        for i in range(20):
+            self.assertFalse(never.next())
+            self.assertTrue(always.next())
+
+    def test_gaps(self):
+        gate = _GeometricGate(0.1, np.random.default_rng(SEED), block=8)
+        gaps = np.random.default_rng(SEED).geometric(0.1, 16)
+        fires = [gate.next() for i in range(int(gaps.sum()))]
+        np.testing.assert_array_equal(np.flatnonzero(fires) + 1, np.cumsum(gaps))
+
+    def test_rate(self):
+        gate = _GeometricGate(0.05, np.random.default_rng(SEED))
+        self.assertAlmostEqual(np.mean([gate.next() for i in range(100000)]), 0.05, delta=0.005)
+
+
+class TestNoiseBuffer(unittest.TestCase):
+
+    def test_init(self):
+        rng = np.random.default_rng(SEED)
+        self.assertEqual(_NoiseBuffer(4, "normal", rng).shape, (4,))
+        self.assertEqual(_NoiseBuffer((2, 3), "uniform", rng).shape, (2, 3))
+        self.assertEqual(_NoiseBuffer((1024, 1024), "normal", rng).block, 1)
+        with self.assertRaises(ValueError):
+            _NoiseBuffer((), "beta", rng)
+
+    def test_next(self):
+        noise = _NoiseBuffer((), "uniform", np.random.default_rng(SEED), block=8)
+        samples = [noise.next() for i in range(20)]
+        self.assertTrue(all(isinstance(sample, float) and 0.0 <= sample < 1.0 for sample in samples))
+
+        noise = _NoiseBuffer((4,), "normal", np.random.default_rng(SEED), block=8)
+        for i in range(20):
+            self.assertEqual(noise.next().shape, (4,))
+
+    def test_dtype(self):
+        rng = np.random.default_rng(SEED)
+        self.assertEqual(_NoiseBuffer((4,), "normal", rng, dtype=np.float32).next().dtype, np.float32)
+        self.assertEqual(_NoiseBuffer((4,), "uniform", rng, dtype=np.float32).next().dtype, np.float32)
+        self.assertEqual(_NoiseBuffer((4,), "normal", rng, dtype=np.float16).next().dtype, np.float64)
+        self.assertEqual(_NoiseBuffer((4,), "normal", rng, dtype=np.uint8).next().dtype, np.float64)
+
+
 if __name__ == '__main__':
     unittest.main()